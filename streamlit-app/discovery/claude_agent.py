@@ -10,6 +10,7 @@ import re
 import socket
 import threading
 import time
+from contextlib import AsyncExitStack
 from typing import Optional, List, Dict, Any, Callable
 from urllib.parse import urlparse, urljoin, quote_plus
 
@@ -28,10 +29,9 @@ from .document_types import (
     get_doc_keywords,
     get_page_keywords,
     get_llm_classification_prompt,
-    get_title_keywords,
-    get_content_keywords,
     get_pdf_keywords,
     get_pdf_exclusions,
+    match_keyword_types,
 )
 
 
@@ -1722,18 +1722,15 @@ class ClaudeAgent:
                     # should be visited first. Without this, portals with many exhibitor_
                     # manual/rules links (like MWC with 10+ regulation pages) can push
                     # schedule links past the [:8] cutoff.
-                    schedule_kws = get_title_keywords('schedule') + get_content_keywords('schedule')
-                    floorplan_kws = get_title_keywords('floorplan') + get_content_keywords('floorplan')
-                    rules_kws = get_title_keywords('rules')
-
                     def _link_priority(lnk):
                         """Lower = higher priority. Schedule first, then floorplan, then rules, then rest."""
                         lt = (lnk.text or '').lower() + ' ' + lnk.url.lower()
-                        if any(kw in lt for kw in schedule_kws):
+                        found = match_keyword_types(lt)
+                        if 'schedule' in found:
                             return 0
-                        if any(kw in lt for kw in floorplan_kws):
+                        if 'floorplan' in found:
                             return 1
-                        if any(kw in lt for kw in rules_kws):
+                        if match_keyword_types(lt, 'rules', ('title_keywords',)):
                             return 2
                         return 3
 
@@ -2063,17 +2060,17 @@ Reply with ONLY a JSON array of objects, one per page. Example:
         # Order matters: exhibitor_manual general T&C → rules → schedule → floorplan → exhibitor_manual general
         check_order = ['exhibitor_manual', 'rules', 'schedule', 'floorplan']
 
+        title_types = match_keyword_types(url_title, fields=('title_keywords',))
         for doc_type in check_order:
-            title_kws = get_title_keywords(doc_type)
-            if title_kws and any(kw in url_title for kw in title_kws):
+            if doc_type in title_types:
                 return doc_type
 
         # === PHASE 2: Content analysis (for pages with generic URL/title) ===
         combined = f"{url_title} {page_text[:1500]}".lower()
 
+        content_types = match_keyword_types(combined, fields=('content_keywords',))
         for doc_type in check_order:
-            content_kws = get_content_keywords(doc_type)
-            if content_kws and any(kw in combined for kw in content_kws):
+            if doc_type in content_types:
                 return doc_type
 
         return 'unknown'
@@ -2663,6 +2660,8 @@ Reply with ONLY a JSON array of objects, one per page. Example:
                     for k, v in self._sd.items()}  # Reset summary data
 
         start_time = time.time()
+        # Per-run resources (the document classifier), released in the finally below
+        cleanup = AsyncExitStack()
 
         try:
             # If no known_url, try to find it via web search (Brave + DuckDuckGo fallback)
@@ -2839,6 +2838,7 @@ Reply with ONLY a JSON array of objects, one per page. Example:
             if pre_scan_results['pdf_links'] or portal_pages:
                 self._log("📋 Starting STRICT document classification with LLM...")
                 classifier = DocumentClassifier(self.client, self._log)
+                cleanup.push_async_callback(classifier.close)
 
                 classification_result = await classifier.classify_documents(
                     pdf_links=pre_scan_results['pdf_links'],
@@ -2952,6 +2952,8 @@ Reply with ONLY a JSON array of objects, one per page. Example:
                         elif classification_result.skip_agent_safe and not schedule_found_2:
                             self._log(f"⚠️ Secondary scan: kwaliteitscheck OK maar schema ontbreekt nog — agent draait")
 
+                await cleanup.aclose()
+
             # Format pre-scan results for the agent
             if pre_scan_results['pdf_links']:
                 pre_scan_info += "\n\n🎯 PRE-SCAN RESULTATEN - DOCUMENTEN GEVONDEN VOORAF:\n"
@@ -3475,6 +3477,7 @@ BELANGRIJK: Voeg voor elk document validation_notes toe die bewijzen dat het aan
             raise
 
         finally:
+            await cleanup.aclose()
             await self.browser.close()
 
         return output
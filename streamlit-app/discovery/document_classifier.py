@@ -16,9 +16,25 @@ QUALITY ASSURANCE:
 import re
 import io
 import json
+import hashlib
+import random
+import os
 import asyncio
+import atexit
+import multiprocessing
+import sqlite3
 import tempfile
-from dataclasses import dataclass, field
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, asdict, replace
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
+from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from urllib.parse import urlparse
 import urllib.request
@@ -30,24 +46,145 @@ from discovery.document_types import (
     get_known_floorplan_providers,
     get_content_keywords,
     get_title_keywords,
-    get_scoring_keywords,
+    score_text,
+    get_pdf_keywords,
+    get_pdf_exclusions,
     get_type_search_hints,
     get_llm_classification_prompt,
 )
 
-# Try to import PDF library
+# Try to import PDF library (PyMuPDF is 5-30x faster than pypdf for text)
+try:
+    import fitz  # PyMuPDF
+    FITZ_SUPPORT = True
+except ImportError:
+    FITZ_SUPPORT = False
+
 try:
     import pypdf
-    PDF_SUPPORT = True
+    PYPDF_SUPPORT = True
 except ImportError:
     try:
         import PyPDF2 as pypdf
-        PDF_SUPPORT = True
+        PYPDF_SUPPORT = True
     except ImportError:
-        PDF_SUPPORT = False
+        PYPDF_SUPPORT = False
+
+PDF_SUPPORT = FITZ_SUPPORT or PYPDF_SUPPORT
+
+# Optional: orjson parses/serializes 2-3x faster than the stdlib json module
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
+# Optional: Aho-Corasick automaton for single-pass multi-keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_SUPPORT = True
+except ImportError:
+    AHOCORASICK_SUPPORT = False
 
+# Optional: native async Anthropic client (else the sync client runs in threads)
+try:
+    from anthropic import AsyncAnthropic
+    ASYNC_ANTHROPIC_SUPPORT = True
+except ImportError:
+    ASYNC_ANTHROPIC_SUPPORT = False
 
-@dataclass
+# Optional: requests keeps connections alive between PDF probes/downloads
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    REQUESTS_SUPPORT = True
+except ImportError:
+    REQUESTS_SUPPORT = False
+
+# PDFs with less meaningful text than this are not worth an LLM call
+# (OCR-less scans, empty PDFs). Typical discovery noise.
+MIN_USEFUL_CHARS = 300
+# Portal pages are shorter: a schedule or contact page can be a few lines
+MIN_USEFUL_PAGE_CHARS = 100
+# Document text considered for Haiku validation: for longer documents the
+# head, the tail and the passage around the first year/fair mention past the
+# head, so schedules and contacts at the end of a long PDF are not cut off
+LLM_MAX_TEXT_CHARS = 10000
+LLM_WINDOW_EDGE_CHARS = 4000
+LLM_WINDOW_MATCH_CHARS = 2000
+# Of that, what is actually sent: the document head plus the highest-signal
+# blocks (dates, contacts, type keywords) up to this many characters
+LLM_EXCERPT_CHARS = 4000
+LLM_EXCERPT_HEAD_CHARS = 500
+LLM_EXCERPT_BLOCK_CHARS = 400
+# Prescan text for a PDF this long is used as its content instead of
+# downloading it again; shorter text is just the link's anchor text
+PREFETCHED_TEXT_MIN_CHARS = 2000
+# PDFs listed in the single URL/link-text classification call
+BATCH_CLASSIFY_MAX_PDFS = 60
+# Documents validated together in one Haiku call (portal pages and PDFs whose
+# validations are queued at the same time), and the excerpt per document
+BULK_VALIDATION_CHUNK = 10
+BULK_EXCERPT_CHARS = 3000
+# Max concurrent Haiku calls per classifier (stays within Anthropic rate limits);
+# override with CLASSIFY_CONCURRENCY for accounts with a different tier
+LLM_CONCURRENCY = int(os.getenv("CLASSIFY_CONCURRENCY", "8"))
+# Opt-in (CLASSIFY_TRUST_URL=1): accept a PDF as strong without download or
+# LLM when its URL carries both a keyword of the expected type and the target
+# year. Faster, but unverified — off by default.
+TRUST_URL_MATCHES = os.getenv("CLASSIFY_TRUST_URL", "") == "1"
+# Max concurrent PDF downloads, kept low so fair sites don't throttle us
+PDF_FETCH_CONCURRENCY = 4
+# Validations queued within this window of each other are sent together
+BATCH_COLLECT_WINDOW = 0.5  # seconds
+# Opt-in for offline runs (CLASSIFY_BATCH_API=1): the Message Batches API
+# (50% token price, minutes of latency) for at least BATCH_API_MIN_REQUESTS
+# validations queued together. Interactive runs use bulk Haiku calls instead.
+USE_BATCH_API = os.getenv("CLASSIFY_BATCH_API", "") == "1"
+BATCH_API_MIN_REQUESTS = 20
+BATCH_POLL_INTERVAL = 10  # seconds
+BATCH_MAX_WAIT = 3 * 60  # seconds; then cancel and fall back to bulk calls
+# Share of non-printable characters above which extracted text is treated as
+# binary garbage (broken font encodings, undecoded streams).
+MAX_GARBAGE_RATIO = 0.3
+# URL/title relevance at or below which a document that also fails the local
+# precheck is dropped outright instead of kept as a weak candidate
+PRECHECK_REJECT_SCORE = -3
+# Pages read per PDF — schedules and contacts are rarely further in
+PDF_MAX_PAGES = 10
+# ...and fewer once this much text is in and a page has the year plus dates
+# or contact details (about what the condensed LLM excerpt holds anyway)
+PDF_EARLY_EXIT_CHARS = 4000
+# ...and never more than this much text: dense pages (tables, price lists)
+# beyond it only feed the LLM window's tail, not the validation
+PDF_MAX_TEXT_CHARS = 30000
+# PDF download window: most PDFs are fully parseable (or at least their first
+# pages are) from the first PDF_INITIAL_BYTES. Only when a truncated download
+# can't be parsed is the file fetched again, up to PDF_MAX_BYTES.
+PDF_INITIAL_BYTES = 512 * 1024
+PDF_MAX_BYTES = 20 * 1024 * 1024
+PDF_CHUNK_SIZE = 64 * 1024
+# Prefix hashed to tell a replaced PDF from the cached one when the server
+# sends neither ETag nor Last-Modified
+PDF_FINGERPRINT_BYTES = 64 * 1024
+# Pooled keep-alive connections per host for PDF probes/downloads
+HTTP_POOL_SIZE = 16
+# Worker processes for PDF text extraction (CPU-bound, kept off the event loop)
+PDF_WORKERS = min(4, os.cpu_count() or 1)
+# Persistent cache of validated documents: re-runs for the same fair skip the
+# download, PDF parse and LLM call. Lives next to fairs.json (see data_manager).
+CLASSIFICATION_CACHE_FILE = Path(__file__).parent.parent / "data" / "classification_cache.db"
+CLASSIFICATION_CACHE_TTL = 7 * 24 * 3600  # seconds
+# LLM answers kept in memory per classifier (older ones are still on disk)
+LLM_MEMO_SIZE = 512
+# Raw Haiku validation answers are cached in the same DB. Bump PROMPT_VERSION
+# whenever the validation prompts change so stale answers are not reused.
+PROMPT_VERSION = "v3"
+# Page text that goes into the portal-page cache key
+CACHE_PAGE_TEXT_CHARS = 4096
+
+
+@dataclass(slots=True)
 class ExtractedSchedule:
     """Schedule info extracted from a document."""
     build_up: List[Dict] = field(default_factory=list)  # [{date, time, description}]
@@ -55,7 +192,7 @@ class ExtractedSchedule:
     source_url: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedContact:
     """Contact info extracted from a document."""
     emails: List[str] = field(default_factory=list)
@@ -64,7 +201,7 @@ class ExtractedContact:
     source_url: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentClassification:
     """Classification result for a single document."""
     url: str
@@ -91,7 +228,24 @@ class DocumentClassification:
     also_contains: List[str] = field(default_factory=list)  # Other doc types found in this doc
 
 
-@dataclass
+# Document types with a DocumentClassification slot on ClassificationResult
+RESULT_TYPES = ('floorplan', 'exhibitor_manual', 'rules', 'schedule')
+
+# Descriptions and search hints per missing type for the agent prompt
+_MISSING_TYPE_DESCRIPTIONS = {
+    'floorplan': 'Plattegrond/floorplan van de beurshallen',
+    'exhibitor_manual': 'Exposanten handleiding/manual met standbouw regels',
+    'rules': 'Technische richtlijnen/regulations voor standbouw (BEURS-SPECIFIEK, niet van de venue!)',
+    'schedule': 'Opbouw/afbouw schema met datums en tijden',
+}
+# Search hints from central document_types registry
+_MISSING_TYPE_SEARCH_HINTS = {
+    doc_type: tuple(get_type_search_hints(doc_type))
+    for doc_type in DOCUMENT_TYPES
+}
+
+
+@dataclass(slots=True)
 class ClassificationResult:
     """Overall classification results for all document types."""
     floorplan: Optional[DocumentClassification] = None
@@ -123,26 +277,11 @@ class ClassificationResult:
         if not self.missing_types:
             return ""
 
-        type_descriptions = {
-            'floorplan': 'Plattegrond/floorplan van de beurshallen',
-            'exhibitor_manual': 'Exposanten handleiding/manual met standbouw regels',
-            'rules': 'Technische richtlijnen/regulations voor standbouw (BEURS-SPECIFIEK, niet van de venue!)',
-            'schedule': 'Opbouw/afbouw schema met datums en tijden',
-        }
-
-        # Search hints from central document_types registry
-        type_search_hints = {
-            doc_type: get_type_search_hints(doc_type)
-            for doc_type in DOCUMENT_TYPES
-        }
-
         lines = ["NOG TE VINDEN (focus hierop):"]
         for doc_type in self.missing_types:
-            desc = type_descriptions.get(doc_type, doc_type)
+            desc = _MISSING_TYPE_DESCRIPTIONS.get(doc_type, doc_type)
             lines.append(f"  ✗ {doc_type}: {desc}")
-            hints = type_search_hints.get(doc_type, [])
-            for hint in hints:
-                lines.append(f"    → {hint}")
+            lines.extend(f"    → {hint}" for hint in _MISSING_TYPE_SEARCH_HINTS.get(doc_type, ()))
 
         # Add document references as extra hints
         if self.extra_urls_to_scan:
@@ -160,26 +299,1220 @@ class ClassificationResult:
         lines = ["REEDS GEVONDEN (niet meer zoeken):"]
 
         # Only show documents with STRONG confidence as truly found
-        if self.floorplan and self.floorplan.confidence == 'strong':
-            lines.append(f"  ✓ floorplan: {self.floorplan.url}")
-        if self.exhibitor_manual and self.exhibitor_manual.confidence == 'strong':
-            lines.append(f"  ✓ exhibitor_manual: {self.exhibitor_manual.url}")
-        if self.rules and self.rules.confidence == 'strong':
-            lines.append(f"  ✓ rules: {self.rules.url}")
-        if self.schedule and self.schedule.confidence == 'strong':
-            lines.append(f"  ✓ schedule: {self.schedule.url}")
+        for doc_type in RESULT_TYPES:
+            doc = getattr(self, doc_type)
+            if doc and doc.confidence == 'strong':
+                lines.append(f"  ✓ {doc_type}: {doc.url}")
         if self.exhibitor_directory:
             lines.append(f"  ✓ exhibitor_directory: {self.exhibitor_directory}")
 
         return "\n".join(lines)
 
 
+def _content_key(
+    url: str,
+    text_content: str,
+    expected_type: str,
+    fair_name: str,
+    target_year: str,
+    city: str = "",
+) -> str:
+    """Stable ID for one LLM validation request, derived from everything in its prompt.
+
+    Whitespace in the text is collapsed first, so re-extractions that only
+    differ in line breaks or spacing (another PDF backend, a re-rendered
+    page) reuse the cached answer. Truncated to 60 hex chars so it also
+    fits the 64-char custom_id limit of the Message Batches API.
+    """
+    text = ' '.join(text_content.split())
+    key = "\x1f".join((url, expected_type, fair_name, target_year, city, text))
+    return hashlib.sha256(key.encode('utf-8', errors='replace')).hexdigest()[:60]
+
+
+def _json_loads(data):
+    """json.loads via orjson when available (accepts str or bytes)."""
+    if ORJSON_SUPPORT:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Compact UTF-8 JSON bytes, via orjson when available."""
+    if ORJSON_SUPPORT:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+_FENCE_RE = re.compile(r'```(?:json)?\s*(.*?)\s*```', re.DOTALL)
+
+
+def _parse_llm_json(response_text: str):
+    """Parse a JSON answer from the LLM, unwrapping a ```json fence if present.
+
+    If the answer has prose around the object ("Here is the result: {...}"),
+    the outermost {...} span is parsed instead.
+    """
+    response_text = response_text.strip()
+    if "```" in response_text:
+        json_match = _FENCE_RE.search(response_text)
+        if json_match:
+            response_text = json_match.group(1)
+    try:
+        return _json_loads(response_text)
+    except ValueError:
+        start, end = response_text.find('{'), response_text.rfind('}')
+        if start < 0 or end <= start:
+            raise
+        return _json_loads(response_text[start:end + 1])
+
+
+def _dedupe_schedule_entries(entries) -> List[Dict]:
+    """Schedule entries with duplicate (date, time) dropped, first seen kept."""
+    unique: Dict[Tuple[str, str], Dict] = {}
+    for entry in entries:
+        unique.setdefault((entry.get('date', ''), entry.get('time', '')), entry)
+    return list(unique.values())
+
+
+def _fallback_validation(text_content: str, target_year: str, error: str) -> Dict:
+    """Basic checks standing in for an LLM validation that failed. The
+    'LLM validatie gefaald' reason keeps the outcome out of the caches."""
+    return {
+        'is_correct_type': False,
+        'is_correct_fair': False,
+        'is_correct_year': target_year in text_content,
+        'is_useful': len(text_content) > 500,
+        'reason': f'LLM validatie gefaald: {error}'
+    }
+
+
+def _classification_cache_key(*parts: str) -> str:
+    """Cache key for one validation: url, type, fair, year, city (+ page text
+    hash, or PDF content version)."""
+    return hashlib.sha256("|".join(parts).encode('utf-8', errors='replace')).hexdigest()
+
+
+def _page_cache_key(
+    url: str, text_content: str, expected_type: str, fair_name: str, target_year: str, city: str
+) -> str:
+    """Cache key for a portal page: like a PDF's, plus a hash of the page text."""
+    text_hash = hashlib.sha256(
+        (text_content or "")[:CACHE_PAGE_TEXT_CHARS].encode('utf-8', errors='replace')
+    ).hexdigest()
+    return _classification_cache_key(url, expected_type, fair_name, target_year, city, text_hash)
+
+
+def _classification_from_dict(data: Dict) -> DocumentClassification:
+    """Rebuild a DocumentClassification (incl. nested schedule/contacts) from asdict()."""
+    data = dict(data)
+    if data.get('extracted_schedule'):
+        data['extracted_schedule'] = ExtractedSchedule(**data['extracted_schedule'])
+    if data.get('extracted_contacts'):
+        data['extracted_contacts'] = ExtractedContact(**data['extracted_contacts'])
+    return DocumentClassification(**data)
+
+
+# Tables in CLASSIFICATION_CACHE_FILE: validated classifications, raw LLM
+# answers, extracted PDF text
+_CACHE_TABLES = ('cache', 'llm_cache', 'pdf_text')
+
+# Cache files whose tables exist already (schema is created once per process)
+_cache_schemas_ready: set = set()
+_cache_schema_lock = threading.Lock()
+
+
+def _cache_connect() -> sqlite3.Connection:
+    """Connection to the cache DB; creates the tables on first use.
+
+    Blocking: async callers go through asyncio.to_thread.
+    """
+    if CLASSIFICATION_CACHE_FILE not in _cache_schemas_ready:
+        with _cache_schema_lock:
+            if CLASSIFICATION_CACHE_FILE not in _cache_schemas_ready:
+                CLASSIFICATION_CACHE_FILE.parent.mkdir(exist_ok=True)
+                with closing(sqlite3.connect(CLASSIFICATION_CACHE_FILE, timeout=5)) as conn, conn:
+                    for table in _CACHE_TABLES:
+                        conn.execute(
+                            f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, payload BLOB, ts INTEGER)"
+                        )
+                _cache_schemas_ready.add(CLASSIFICATION_CACHE_FILE)
+    return sqlite3.connect(CLASSIFICATION_CACHE_FILE, timeout=5)
+
+
+def _cache_read(table: str, key: str):
+    """Decoded JSON payload for key, or None if missing/expired/unreadable."""
+    try:
+        with closing(_cache_connect()) as conn:
+            row = conn.execute(
+                f"SELECT payload FROM {table} WHERE key = ? AND ts >= ?",
+                (key, int(time.time()) - CLASSIFICATION_CACHE_TTL),
+            ).fetchone()
+        return _json_loads(row[0]) if row else None
+    except Exception:
+        # Cache is best-effort: a broken/locked DB just means a fresh validation
+        return None
+
+
+def _cache_write(table: str, key: str, payload) -> None:
+    try:
+        with closing(_cache_connect()) as conn, conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO {table} (key, payload, ts) VALUES (?, ?, ?)",
+                (key, _json_dumps(payload), int(time.time())),
+            )
+    except Exception:
+        pass
+
+
+def _cache_get(key: str) -> Optional[DocumentClassification]:
+    """Cached classification for key, or None."""
+    data = _cache_read('cache', key)
+    try:
+        return _classification_from_dict(data) if data else None
+    except TypeError:
+        return None  # written by an older DocumentClassification layout
+
+
+def _cache_put(key: str, classification: DocumentClassification) -> None:
+    _cache_write('cache', key, asdict(classification))
+
+
+def _llm_cache_key(content_key: str) -> str:
+    """Persistent key for an LLM answer: the request's content key + PROMPT_VERSION."""
+    return hashlib.sha256(f"{PROMPT_VERSION}|{content_key}".encode()).hexdigest()
+
+
+def _pdf_text_cache_key(url: str, target_year: str, version: str) -> str:
+    """Key for a PDF's extracted text. The year is part of it because
+    extraction stops early once the target year has been seen; version (see
+    _pdf_version) keeps a PDF replaced under the same URL from hitting."""
+    return hashlib.sha256(f"{url}|{target_year}|{version}".encode('utf-8', errors='replace')).hexdigest()
+
+
+def _is_cacheable(classification: DocumentClassification) -> bool:
+    """Only cache real outcomes — not download failures or failed LLM calls."""
+    return classification.content_verified and not classification.reason.startswith(
+        ('LLM validatie gefaald', 'Validatie fout', 'Portal page validatie fout')
+    )
+
+
+def _pdf_page_texts(pdf_bytes: bytes, max_pages: int):
+    """Yield the text of the first max_pages pages, one page at a time.
+
+    PyMuPDF when available, else pypdf. Lazy, so callers that stop early
+    don't pay for parsing the remaining pages.
+    """
+    if FITZ_SUPPORT:
+        try:
+            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        except Exception:
+            # Fall back to pypdf, which tolerates some damaged files
+            if not PYPDF_SUPPORT:
+                raise
+        else:
+            with doc:
+                for i in range(min(doc.page_count, max_pages)):
+                    yield doc[i].get_text()
+            return
+
+    reader = pypdf.PdfReader(io.BytesIO(pdf_bytes))
+    for page in islice(reader.pages, max_pages):
+        try:
+            yield page.extract_text()
+        except:
+            continue
+
+
+def _extract_text_from_pdf_bytes(
+    pdf_bytes: bytes, max_pages: int = PDF_MAX_PAGES, target_year: str = ""
+) -> str:
+    """Text of the first max_pages pages.
+
+    With a target_year, parsing stops early once enough text has been read
+    and the last page mentions the year next to dates or contact details —
+    the rest of the document would not change the validation. Parsing also
+    stops once PDF_MAX_TEXT_CHARS have been read.
+    """
+    text_parts = []
+    size = 0
+    for text in _pdf_page_texts(pdf_bytes, max_pages):
+        if not text:
+            continue
+        text_parts.append(text)
+        size += len(text)
+        if size >= PDF_MAX_TEXT_CHARS:
+            break
+        if (target_year and size >= PDF_EARLY_EXIT_CHARS and target_year in text
+                and _EXCERPT_SIGNAL_RE.search(text)):
+            break
+    return "\n".join(text_parts)
+
+
+_HTTP_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+
+def _new_http_session() -> Optional["requests.Session"]:
+    """Keep-alive session for PDF probes and downloads. Candidate PDFs mostly
+    sit on a handful of hosts, so reusing connections saves a TCP/TLS
+    handshake per document. None without requests (plain urllib then)."""
+    if not REQUESTS_SUPPORT:
+        return None
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update(_HTTP_HEADERS)
+    return session
+
+
+def _http_get(session: Optional["requests.Session"], url: str, headers: Dict[str, str], timeout: int = 20):
+    """Streamed GET: (response, iterator over body chunks).
+
+    Goes through session when given, urllib otherwise; HTTP errors raise
+    urllib.error.HTTPError either way.
+    """
+    if session is None:
+        req = urllib.request.Request(url, headers={**_HTTP_HEADERS, **headers})
+        response = urllib.request.urlopen(req, timeout=timeout)
+        return response, iter(lambda: response.read(PDF_CHUNK_SIZE), b'')
+    response = session.get(url, headers=headers, stream=True, timeout=timeout)
+    if response.status_code >= 400:
+        response.close()
+        raise urllib.error.HTTPError(url, response.status_code, response.reason, response.headers, None)
+    return response, response.iter_content(PDF_CHUNK_SIZE)
+
+
+def _download_pdf_bytes(session: Optional["requests.Session"], url: str, max_bytes: int) -> bytes:
+    """Blocking download of the first max_bytes of url (run via asyncio.to_thread).
+
+    Asks for just that prefix with a Range header; servers that ignore it
+    answer 200 with the full body, which is streamed in chunks and cut off
+    at the cap, so a 20 MB manual costs no more bandwidth than the window we
+    actually parse.
+    """
+    headers = {'Range': f'bytes=0-{max_bytes - 1}'}
+    try:
+        response, chunks = _http_get(session, url, headers)
+    except urllib.error.HTTPError as e:
+        if e.code != 416:
+            raise
+        # Range Not Satisfiable (some servers reject any range): plain GET
+        response, chunks = _http_get(session, url, {})
+
+    buf = bytearray()
+    with response:
+        for chunk in chunks:
+            buf += chunk[:max_bytes - len(buf)]
+            if len(buf) >= max_bytes:
+                break
+    return bytes(buf)
+
+
+# Content types that are certainly not a PDF (error and login pages served
+# under a .pdf link); anything else, including octet-stream, is downloaded
+_NON_PDF_CONTENT_TYPES = ('text/html', 'text/plain', 'application/xhtml', 'application/json')
+
+
+_NON_DIGIT_RE = re.compile(r'\D')
+
+
+def _phone_key(phone: str) -> str:
+    """Dedup key for a phone number: digits only, with the 00 international
+    prefix folded onto +, so '+31 20 123' and '0031-20-123' match."""
+    digits = _NON_DIGIT_RE.sub('', phone)
+    return digits[2:] if digits.startswith('00') else digits
+
+
+# HEAD statuses that may well be different on the next try: not remembered
+_TRANSIENT_HTTP_STATUSES = frozenset({0, 408, 425, 429})
+
+
+def _probe_result(status: int, headers) -> Tuple[int, str, str]:
+    """(status, content type, version) from HEAD response headers; version is
+    the ETag, else Last-Modified, else ''."""
+    version = headers.get('ETag') or headers.get('Last-Modified') or ''
+    return status, headers.get('Content-Type', '').lower(), version
+
+
+def _probe_pdf_url(session: Optional["requests.Session"], url: str) -> Tuple[int, str, str]:
+    """Blocking HEAD request: (status, content type, version) of url,
+    (0, '', '') when unknown."""
+    try:
+        if session is not None:
+            response = session.head(url, allow_redirects=True, timeout=10)
+            return _probe_result(response.status_code, response.headers)
+        req = urllib.request.Request(url, method='HEAD', headers=_HTTP_HEADERS)
+        with urllib.request.urlopen(req, timeout=10) as response:
+            return _probe_result(response.status, response.headers)
+    except urllib.error.HTTPError as e:
+        return e.code, '', ''
+    except Exception:
+        return 0, '', ''
+
+
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+# Set once worker processes turn out to be unavailable (sandboxed hosts,
+# killed workers); parsing then stays in threads for the rest of the session
+_pdf_pool_disabled = False
+# Discovery jobs run in parallel threads (see job_manager), each with its own
+# event loop: pool creation and teardown go through this lock
+_pdf_pool_lock = threading.Lock()
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Shared process pool for PDF parsing, created on first use.
+
+    Workers are started with forkserver (spawn where that is unavailable,
+    e.g. Windows): forking the multi-threaded app would copy locks held by
+    other jobs' threads into the children.
+    """
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _pdf_pool = ProcessPoolExecutor(
+                max_workers=PDF_WORKERS, mp_context=multiprocessing.get_context(method)
+            )
+        return _pdf_pool
+
+
+def _shutdown_pdf_pool() -> None:
+    """Stop the worker processes (registered with atexit)."""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is not None:
+            _pdf_pool.shutdown(wait=False, cancel_futures=True)
+            _pdf_pool = None
+
+
+atexit.register(_shutdown_pdf_pool)
+
+
+def _disable_pdf_pool() -> None:
+    """Drop the (broken) process pool and fall back to thread parsing."""
+    global _pdf_pool_disabled
+    _pdf_pool_disabled = True
+    _shutdown_pdf_pool()
+
+
+def _keyword_regex(keywords: List[str]) -> Optional[re.Pattern]:
+    """One compiled alternation for a keyword list: a single C-level scan
+    instead of `any(kw in text for kw in keywords)`. None for an empty list."""
+    if not keywords:
+        return None
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+# Registry keyword lists compiled once at import (all keywords are lowercase,
+# callers match against lowercased text)
+_PDF_KEYWORD_RE = {t: _keyword_regex(get_pdf_keywords(t)) for t in DOCUMENT_TYPES}
+_PDF_EXCLUSION_RE = {t: _keyword_regex(get_pdf_exclusions(t)) for t in DOCUMENT_TYPES}
+_YEAR_RE = re.compile(r'20\d{2}')
+
+# Exhibitor directory scoring, matched against the lowercased URL path:
+# exact directory path endings, then (pattern, points) indicators, then the
+# penalty for resource/service pages
+_DIR_EXACT_SUFFIXES = ('/exhibitors', '/exhibitor-list', '/exhibitor-lists')
+_DIR_SCORER = (
+    (_keyword_regex(['directory', 'catalogue', 'catalog', '/exhibitors']), 5),
+    (_keyword_regex(['exhibitor-list', 'exhibitor list', '/companies', '/espositori', '/aussteller']), 5),
+    (_keyword_regex(['/list', 'exposant']), 3),
+)
+_DIR_PENALTY_RE = _keyword_regex([
+    'resource', 'service', 'download', 'manual', 'guide', 'technical',
+    'checklist', 'register', 'login', 'dashboard', 'faq',
+    'shipping', 'marketing', 'contact', 'order', 'profile',
+])
+
+
+# Portal-page heuristics (lowercase; matched against lowercased URLs/titles).
+# Shared-host portal platforms: many fairs' portals live on the same host.
+# Filler words never used on their own as fair-name keywords
+_FAIR_NAME_STOPWORDS = frozenset({'the', 'and', 'for', 'van', 'het', 'een'})
+_PORTAL_DOMAINS = ('my.site.com', 'force.com', 'cvent.com', 'swapcard.com')
+_KNOWN_FLOORPLAN_PROVIDERS = tuple(get_known_floorplan_providers())
+_FLOORPLAN_URL_PATTERNS = tuple(DOCUMENT_TYPES['floorplan'].get('url_patterns', []))
+_SCHEDULE_URL_SLUGS = (
+    'schedule', 'build-up', 'tear-down', 'dismantling', 'move-in',
+    'move-out', 'deadlines', 'key-dates', 'timetable', 'set-up',
+    'logistics', 'important-dates', 'access-policy', 'event-schedule',
+)
+# The URL lists above as single alternations (one scan per URL)
+_PORTAL_DOMAIN_RE = _keyword_regex(list(_PORTAL_DOMAINS))
+_FLOORPLAN_PROVIDER_RE = _keyword_regex(list(_KNOWN_FLOORPLAN_PROVIDERS))
+_FLOORPLAN_URL_RE = _keyword_regex(list(_FLOORPLAN_URL_PATTERNS))
+_SCHEDULE_URL_SLUG_RE = _keyword_regex(list(_SCHEDULE_URL_SLUGS))
+
+
+@lru_cache(maxsize=4096)
+def _cached_urlparse(url: str):
+    """urlparse, memoized: the same page URLs are parsed in several scoring passes."""
+    return urlparse(url)
+
+# PDF fallback categories, in candidate order
+_PDF_CATEGORIES = ('floorplan', 'exhibitor_manual', 'rules', 'schedule')
+# Distinct PDF keywords per category, for the substring fallback
+_PDF_CATEGORY_KEYWORDS = {t: tuple(dict.fromkeys(get_pdf_keywords(t))) for t in _PDF_CATEGORIES}
+# Tie-break when a PDF matches several categories equally well: the broader
+# document wins (a manual often also covers rules/schedule, see cross-refs)
+_PDF_CATEGORY_PRIORITY = ('exhibitor_manual', 'rules', 'schedule', 'floorplan')
+
+
+def _build_keyword_automaton(keyword_tags):
+    """Aho-Corasick automaton over (keyword, tag) pairs.
+
+    Each match yields (keyword, frozenset of tags), so one linear scan over a
+    text finds every tagged keyword list that occurs in it. None when
+    pyahocorasick isn't installed (callers fall back to compiled regexes).
+    """
+    if not AHOCORASICK_SUPPORT:
+        return None
+    tagged = {}
+    for kw, tag in keyword_tags:
+        tagged.setdefault(kw, set()).add(tag)
+    automaton = ahocorasick.Automaton()
+    for kw, tags in tagged.items():
+        automaton.add_word(kw, (kw, frozenset(tags)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _automaton_tags(automaton, text: str) -> set:
+    """All tags of keywords occurring in text (one pass)."""
+    found = set()
+    for _, (_, tags) in automaton.iter(text):
+        found |= tags
+    return found
+
+
+# PDF keywords tagged ('match', doc_type) and exclusions ('exclude', doc_type),
+# so a single scan yields both the matching categories and their vetoes
+_PDF_KEYWORD_AUTOMATON = _build_keyword_automaton(
+    [(kw, ('match', t)) for t in _PDF_CATEGORIES for kw in get_pdf_keywords(t)]
+    + [(kw, ('exclude', t)) for t in _PDF_CATEGORIES for kw in get_pdf_exclusions(t)]
+)
+
+# Page content type detection, in priority order
+_CONTENT_DETECT_TYPES = ('rules', 'schedule', 'floorplan')
+_CONTENT_KEYWORD_RE = {t: _keyword_regex(get_content_keywords(t)) for t in _CONTENT_DETECT_TYPES}
+_CONTENT_KEYWORD_AUTOMATON = _build_keyword_automaton(
+    [(kw, t) for t in _CONTENT_DETECT_TYPES for kw in get_content_keywords(t)]
+)
+@lru_cache(maxsize=4096)
+def _relevance_scores(combined: str) -> Dict[str, int]:
+    """score_text for a lowercased 'url title' string: all types in one go.
+    Memoized: the same URLs are scored for several types and again when
+    pages compete for a slot. Callers must not modify the returned dict."""
+    return score_text(combined)
+
+
+def _relevance_score(doc_type: str, combined: str) -> int:
+    """Relevance of a lowercased 'url title' string to doc_type (strong +10,
+    medium +5, penalties -5)."""
+    return _relevance_scores(combined).get(doc_type, 0)
+
+
+@lru_cache(maxsize=4096)
+def _content_type(combined: str) -> Optional[str]:
+    """First content type (in _CONTENT_DETECT_TYPES priority order) whose
+    keywords occur in a lowercased 'url text' string. Memoized per string."""
+    if _CONTENT_KEYWORD_AUTOMATON is not None:
+        found = _automaton_tags(_CONTENT_KEYWORD_AUTOMATON, combined)
+        return next((t for t in _CONTENT_DETECT_TYPES if t in found), None)
+
+    for doc_type in _CONTENT_DETECT_TYPES:
+        pattern = _CONTENT_KEYWORD_RE[doc_type]
+        if pattern and pattern.search(combined):
+            return doc_type
+    return None
+
+
+def _pdf_keyword_scores(combined: str) -> Dict[str, int]:
+    """Distinct PDF keywords per fallback category found in combined (lowercased
+    url + link text). Categories vetoed by their exclusion list, or without any
+    hit, are left out."""
+    if _PDF_KEYWORD_AUTOMATON is not None:
+        matched: Dict[str, set] = {}
+        excluded = set()
+        for _, (kw, tags) in _PDF_KEYWORD_AUTOMATON.iter(combined):
+            for kind, doc_type in tags:
+                if kind == 'match':
+                    matched.setdefault(doc_type, set()).add(kw)
+                else:
+                    excluded.add(doc_type)
+        return {t: len(kws) for t, kws in matched.items() if t not in excluded}
+
+    # Without the automaton: a substring test per keyword, so overlapping
+    # keywords count exactly as the automaton counts them (a regex
+    # alternation would only report non-overlapping leftmost matches)
+    scores = {}
+    for doc_type in _PDF_CATEGORIES:
+        hits = sum(1 for kw in _PDF_CATEGORY_KEYWORDS[doc_type] if kw in combined)
+        if hits:
+            exclusion_re = _PDF_EXCLUSION_RE.get(doc_type)
+            if exclusion_re and exclusion_re.search(combined):
+                continue
+            scores[doc_type] = hits
+    return scores
+
+
+def _url_strong_match(url: str, expected_type: str, target_year: str) -> bool:
+    """Does the URL alone name the expected type (a PDF keyword, not vetoed by
+    an exclusion) and the target year? Basis for TRUST_URL_MATCHES."""
+    url_lower = url.lower()
+    if not target_year or target_year not in url_lower:
+        return False
+    pdf_re = _PDF_KEYWORD_RE.get(expected_type)
+    if not (pdf_re and pdf_re.search(url_lower)):
+        return False
+    exclusion_re = _PDF_EXCLUSION_RE.get(expected_type)
+    return not (exclusion_re and exclusion_re.search(url_lower))
+
+
+@lru_cache(maxsize=64)
+def _fair_keyword_regex(fair_keywords: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Case-insensitive alternation of a fair's (lowercase) keywords.
+
+    Keyed on the memoized tuple from _extract_fair_keywords, so it is built
+    once per fair; matching case-insensitively spares lowercasing every
+    document.
+    """
+    if not fair_keywords:
+        return None
+    return re.compile('|'.join(map(re.escape, fair_keywords)), re.IGNORECASE)
+
+
+def _local_precheck(text: str, target_year: str, fair_keywords: Tuple[str, ...]) -> Tuple[bool, bool]:
+    """Literal year / fair-name checks done before any LLM call.
+
+    Returns (year_in_text, fair_in_text). The year also matches its short
+    form (2026 or 26); since the short form is contained in the full one,
+    one substring search covers both.
+    """
+    year_hit = target_year[2:] in text
+    fair_re = _fair_keyword_regex(tuple(fair_keywords))
+    fair_hit = bool(fair_re and fair_re.search(text))
+    return year_hit, fair_hit
+
+
+# Signals that a block carries what the validation prompt extracts: dates,
+# times, e-mail addresses and phone numbers
+_EXCERPT_SIGNAL_RE = re.compile(
+    r'\b\d{1,2}[./-]\d{1,2}[./-]\d{2,4}\b'
+    r'|\b\d{1,2}\.?\s*(?:jan|feb|m[aä]r|apr|ma[iy]|jun|jul|aug|sep|o[ck]t|nov|de[cz])[a-zä]*\b'
+    r'|\b(?:jan|feb|m[aä]r|apr|ma[iy]|jun|jul|aug|sep|o[ck]t|nov|de[cz])[a-zä]*\.?\s+\d{1,2}\b'
+    r'|\b\d{1,2}[:.]\d{2}\s*(?:h|uhr|uur|am|pm)?\b'
+    r'|[\w.+-]+@[\w-]+\.[\w.]+'
+    r'|\+?\d[\d ()/-]{7,}\d',
+    re.IGNORECASE,
+)
+_EXCERPT_SCHEDULE_WORDS = (
+    'build-up', 'build up', 'dismantl', 'move-in', 'move-out', 'set-up', 'tear-down',
+    'opbouw', 'afbouw', 'aufbau', 'abbau', 'montaje', 'desmontaje', 'allestimento',
+)
+_EXCERPT_KEYWORD_RE = {
+    t: re.compile(
+        '|'.join(map(re.escape, (*get_content_keywords(t), *_EXCERPT_SCHEDULE_WORDS))),
+        re.IGNORECASE,
+    )
+    for t in DOCUMENT_TYPES
+}
+
+
+def _text_blocks(text: str, max_chars: int) -> List[str]:
+    """Consecutive lines grouped into blocks of about max_chars, split at blank
+    lines. Overlong lines (page text without line breaks) are cut up."""
+    blocks, current, size = [], [], 0
+    lines = (
+        line[i:i + max_chars] if line else line
+        for line in text.split('\n')
+        for i in range(0, max(len(line), 1), max_chars)
+    )
+    for line in lines:
+        if current and (not line.strip() or size + len(line) > max_chars):
+            blocks.append('\n'.join(current))
+            current, size = [], 0
+        if line.strip():
+            current.append(line)
+            size += len(line) + 1
+    if current:
+        blocks.append('\n'.join(current))
+    return blocks
+
+
+def _smart_excerpt(
+    text: str, target_year: str, fair_keywords: Tuple[str, ...],
+    budget: int = LLM_MAX_TEXT_CHARS,
+) -> str:
+    """Cut a long document down to about budget characters for the LLM.
+
+    Keeps the first and last LLM_WINDOW_EDGE_CHARS and the passage around the
+    first mention of the target year or fair name between them, joined by
+    '---' separators. Text within budget is returned unchanged.
+    """
+    if len(text) <= budget:
+        return text
+    edge = min(LLM_WINDOW_EDGE_CHARS, budget // 2)
+    middle = text[edge:-edge]
+    hits = [middle.find(target_year)] if target_year else []
+    fair_re = _fair_keyword_regex(tuple(fair_keywords))
+    match = fair_re.search(middle) if fair_re else None
+    if match:
+        hits.append(match.start())
+    hits = [pos for pos in hits if pos >= 0]
+
+    parts = [text[:edge]]
+    if hits:
+        start = max(0, min(hits) - LLM_WINDOW_MATCH_CHARS // 2)
+        parts.append(middle[start:start + LLM_WINDOW_MATCH_CHARS])
+    parts.append(text[-edge:])
+    return '\n---\n'.join(parts)
+
+
+def _condense_text(
+    text: str, expected_type: str, target_year: str, fair_keywords: Tuple[str, ...],
+    budget: int = LLM_EXCERPT_CHARS,
+) -> str:
+    """Shorten text for the LLM to the parts worth paying tokens for.
+
+    Keeps the document head (title, cover page) and fills the rest of the
+    budget with the blocks scoring highest on dates, contact details, the
+    target year, fair name and expected-type keywords, in document order.
+    Text within budget is returned unchanged.
+    """
+    if len(text) <= budget:
+        return text
+    head = text[:LLM_EXCERPT_HEAD_CHARS]
+    keyword_re = _EXCERPT_KEYWORD_RE.get(expected_type)
+    fair_re = _fair_keyword_regex(tuple(fair_keywords))
+
+    scored = []
+    for idx, block in enumerate(_text_blocks(text[LLM_EXCERPT_HEAD_CHARS:], LLM_EXCERPT_BLOCK_CHARS)):
+        score = len(_EXCERPT_SIGNAL_RE.findall(block)) + 3 * block.count(target_year)
+        if keyword_re:
+            score += 2 * len(keyword_re.findall(block))
+        if fair_re and fair_re.search(block):
+            score += 2
+        scored.append((-score, idx, block))
+
+    remaining = budget - len(head)
+    chosen = []
+    for _, idx, block in sorted(scored):
+        if len(block) <= remaining:
+            chosen.append((idx, block))
+            remaining -= len(block) + 1
+        if remaining < 50:
+            break
+    chosen.sort()
+    return '\n'.join([head, *(block for _, block in chosen)]) if chosen else head
+
+
+def _precheck_prompt_line(precheck: Optional[Tuple[bool, bool]], target_year: str) -> str:
+    """Prompt line stating the local precheck results, so the LLM judgment is anchored to them."""
+    if precheck is None:
+        return ""
+    year_hit, fair_hit = precheck
+    return (f"\nVOORAF GECONTROLEERD (letterlijk in tekst): jaar {target_year} = {'ja' if year_hit else 'nee'}, "
+            f"beursnaam = {'ja' if fair_hit else 'nee'}")
+
+
+def _year_rank(year: Optional[str], target_year: str) -> int:
+    """Candidate order by year: target year, later, earlier, unknown."""
+    if year == target_year:
+        return 0
+    elif year and year > target_year:
+        return 1
+    elif year:
+        return 2
+    return 3
+
+
+def _normalize_pdf_links(pdf_links: List, target_year: str = "") -> List[Dict]:
+    """Prescan PDF entries (dicts, or bare URL strings) as uniform dicts.
+
+    One pass up front gives every later stage (batch prompt, keyword
+    fallback, candidate sort) plain key lookups: url, text, year, rank
+    (_year_rank, the candidate sort key) and combined, the lowercased
+    'url text' the keyword matchers scan.
+
+    A URL listed more than once (different anchor texts) is kept once, at
+    its first position, with the longest text seen for it.
+    """
+    normalized: Dict[str, Dict] = {}
+    for pdf in pdf_links:
+        if isinstance(pdf, dict):
+            url, text, year = pdf.get('url') or '', pdf.get('text') or '', pdf.get('year')
+        else:
+            url, text, year = pdf, '', None
+        if url in normalized and len(text) <= len(normalized[url]['text']):
+            continue
+        normalized[url] = {
+            'url': url, 'text': text, 'year': year,
+            'rank': _year_rank(year, target_year),
+            'combined': f"{url.lower()} {text.lower()}",
+        }
+    return list(normalized.values())
+
+
+def _is_garbled(text: str, sample_size: int = 2000) -> bool:
+    """Heuristic: does extracted text look like binary garbage?"""
+    sample = text[:sample_size]
+    if not sample:
+        return False
+    garbage = sum(1 for ch in sample if not ch.isprintable() and ch not in '\n\r\t')
+    return garbage / len(sample) > MAX_GARBAGE_RATIO
+
+
+# Prompts for _llm_validate_and_extract, split for Anthropic prompt caching:
+# the system prompt (instructions + output schema) is identical for every
+# document of one fair and type, so it is sent with cache_control and only
+# the small per-document user message changes. {expected_type}/{expected_desc}
+# are baked into the system template once per document type at import (see
+# _SYSTEM_TEMPLATES); fair/year/city are filled in per run.
+_VALIDATION_SYSTEM_TEMPLATE = """Je analyseert documenten GRONDIG en extraheert ALLE informatie.
+
+GEZOCHTE BEURS: {fair_name}
+GEZOCHT JAAR: {target_year}
+VERWACHT TYPE: {expected_type} - {expected_desc}{city_warning}
+
+Beantwoord in JSON formaat:
+{{
+  "is_correct_type": true/false,
+  "is_correct_fair": true/false,
+  "is_correct_year": true/false,
+  "is_useful": true/false,
+  "detected_year": "2024/2025/2026/unknown",
+  "title": "document titel",
+  "reason": "korte uitleg",
+
+  "schedule_found": true/false,
+  "build_up": [
+    {{"date": "2026-03-01", "time": "08:00-20:00", "description": "..."}}
+  ],
+  "tear_down": [
+    {{"date": "2026-03-05", "time": "18:00-22:00", "description": "..."}}
+  ],
+
+  "emails": ["email@example.com"],
+  "phones": ["+31 123 456 789"],
+  "organization": "naam van de organisatie",
+
+  "document_references": ["URLs of namen van andere documenten die in dit document worden genoemd, bijv. 'Technical Guidelines available at https://...' of 'See Event Manual for details'"],
+  "also_contains_types": ["andere documenttypes die dit document OOK bevat. Keuzes: 'rules', 'schedule', 'exhibitor_manual', 'floorplan'. Bijv. als een exhibitor manual ook technische regels bevat, zet 'rules'. Als het ook opbouw/afbouw datums en tijden bevat, zet 'schedule'."]
+}}
+
+KWALITEITSEISEN:
+- "is_correct_type" = ALLEEN true als dit ECHT een {expected_type} is
+- "is_correct_fair" = true als document {fair_name} of de beurs-organisator noemt EN het de juiste editie/locatie is{city_clause}
+- "is_correct_year" = true als document {target_year} bevat
+- "is_useful" = true als document nuttige info bevat voor standbouwers
+
+EXTRACTIE (HEEL BELANGRIJK - zoek naar ALLES):
+- Zoek naar opbouw/afbouw datums en tijden (ook als dit niet het verwachte type is!)
+- Maak voor ELKE rij in een opbouw/afbouw tabel een apart entry. Als er per standgrootte (bijv. "Over 950m2", "Under 25m2") verschillende startdatums zijn, maak dan voor ELKE standgrootte een apart build_up entry met de standgrootte in de description.
+- Maak voor ELKE dag van afbouw een apart tear_down entry met datum en openingstijd.
+- Zoek naar contact emails en telefoonnummers
+- Zoek naar de naam van de organiserende partij
+- Zoek naar VERWIJZINGEN naar andere documenten (URLs, documentnamen, "zie document X")
+- Bevat dit document OOK info van een ander type? Bijv. een exhibitor manual/welcome pack kan ook technische regels of een opbouwschema bevatten - dit is HEEL BELANGRIJK om te detecteren!
+
+Antwoord ALLEEN met valide JSON."""
+
+_VALIDATION_PROMPT_TEMPLATE = """Analyseer dit document GRONDIG en extraheer ALLE informatie.
+
+DOCUMENT URL: {url}{precheck}
+
+DOCUMENT TEKST:
+---
+{text_content}
+---
+
+Antwoord ALLEEN met valide JSON in het gevraagde formaat."""
+
+
+def _render_validation_template(expected_type: str) -> str:
+    """Bake the type-specific parts into the validation system prompt template."""
+    expected_desc = DOCUMENT_TYPES.get(expected_type, {}).get('llm_description', expected_type)
+    return (
+        _VALIDATION_SYSTEM_TEMPLATE
+        .replace('{expected_type}', expected_type)
+        .replace('{expected_desc}', expected_desc)
+    )
+
+
+_SYSTEM_TEMPLATES: Dict[str, str] = {
+    doc_type: _render_validation_template(doc_type) for doc_type in DOCUMENT_TYPES
+}
+
+
+@lru_cache(maxsize=256)
+def _validation_system_prompt(expected_type: str, fair_name: str, target_year: str, city: str) -> str:
+    """System prompt for one (type, fair, year, city): the cacheable prefix."""
+    _, city_warning, city_clause = _prompt_fragments(expected_type, city)
+    template = _SYSTEM_TEMPLATES.get(expected_type) or _render_validation_template(expected_type)
+    return template.format_map({
+        'fair_name': fair_name,
+        'target_year': target_year,
+        'city_warning': city_warning,
+        'city_clause': city_clause,
+    })
+
+
+@lru_cache(maxsize=256)
+def _prompt_fragments(expected_type: str, city: str) -> Tuple[str, str, str]:
+    """Per-(type, city) prompt fragments for LLM validation.
+
+    Returns (expected_desc, city_warning, city_clause). Only a handful of
+    combinations exist per run, so they are built once instead of per document.
+    """
+    # Use semantic descriptions from central document_types registry
+    type_def = DOCUMENT_TYPES.get(expected_type, {})
+    expected_desc = type_def.get('llm_description', expected_type)
+
+    if not city:
+        return expected_desc, "", ""
+
+    city_warning = f"""
+GEZOCHTE STAD/EDITIE: {city}
+⚠️ LET OP EDITIE: Sommige beurzen hebben meerdere edities (bijv. Americas, Asia, Europe).
+   Dit document moet specifiek voor de {city}-editie zijn. Als het document voor een ANDERE
+   editie is (bijv. Americas ipv Amsterdam, Asia ipv Barcelona), dan is "is_correct_fair" = false!"""
+    city_clause = f' (moet voor {city} zijn, NIET voor een andere editie zoals Americas/Asia/etc.)'
+    return expected_desc, city_warning, city_clause
+
+
+# Prompt for _revalidate_with_portal_context: fair and year are already
+# confirmed by a sibling page of the same portal, only the type is asked.
+_REVALIDATION_PROMPT_TEMPLATE = """Je hervalideert een portal-pagina met extra context.
+
+CONTEXT: Deze pagina komt van het exhibitor portal "{portal_base}".
+Een andere pagina van HETZELFDE portal is al bevestigd als STRONG voor {fair_name}{city_info} ({target_year}).
+Dat betekent dat dit portal specifiek is voor {fair_name} {target_year}.
+De vraag is ALLEEN: bevat deze pagina nuttige {expected_type} ({expected_desc}) informatie?
+
+DOCUMENT URL: {url}
+VERWACHT TYPE: {expected_type} - {expected_desc}
+
+PAGINA TEKST:
+---
+{text_content}
+---
+
+Beantwoord in JSON formaat:
+{{
+  "is_correct_type": true/false,
+  "is_useful": true/false,
+  "reason": "korte uitleg waarom wel/niet",
+
+  "schedule_found": true/false,
+  "build_up": [
+    {{"date": "2026-03-01", "time": "08:00-20:00", "description": "..."}}
+  ],
+  "tear_down": [
+    {{"date": "2026-03-05", "time": "18:00-22:00", "description": "..."}}
+  ],
+
+  "emails": ["email@example.com"],
+  "phones": ["+31 123 456 789"],
+  "organization": "naam van de organisatie"
+}}
+
+BELANGRIJK:
+- "is_correct_type" = ALLEEN true als dit ECHT {expected_type} content bevat
+- "is_useful" = true als het nuttige, concrete info bevat (niet alleen een menu of linklijst)
+- Je hoeft NIET te checken of het de juiste beurs/jaar is — dat is al bevestigd via het portal
+- Extraheer WEL schedule datums, emails en telefoons als die er staan
+
+Antwoord ALLEEN met valide JSON."""
+
+
+# Prompt for _validate_bulk_chunk: several queued documents judged in one call.
+# Asks for the same fields as _VALIDATION_SYSTEM_TEMPLATE, per page index.
+_BULK_VALIDATION_PROMPT_TEMPLATE = """Analyseer de volgende {page_count} documenten (webpagina's of PDF's). Beoordeel ELK document afzonderlijk en extraheer ALLE informatie.
+
+GEZOCHTE BEURS: {fair_name}
+GEZOCHT JAAR: {target_year}{city_warning}
+
+{pages}
+
+Beantwoord in JSON formaat, met precies één resultaat per document:
+{{
+  "results": [
+    {{
+      "idx": 0,
+      "is_correct_type": true/false,
+      "is_correct_fair": true/false,
+      "is_correct_year": true/false,
+      "is_useful": true/false,
+      "detected_year": "2024/2025/2026/unknown",
+      "title": "document titel",
+      "reason": "korte uitleg",
+      "schedule_found": true/false,
+      "build_up": [{{"date": "2026-03-01", "time": "08:00-20:00", "description": "..."}}],
+      "tear_down": [{{"date": "2026-03-05", "time": "18:00-22:00", "description": "..."}}],
+      "emails": ["email@example.com"],
+      "phones": ["+31 123 456 789"],
+      "organization": "naam van de organisatie",
+      "document_references": ["URLs of namen van andere documenten die in het document worden genoemd"],
+      "also_contains_types": ["andere types die het document OOK bevat: 'rules', 'schedule', 'exhibitor_manual', 'floorplan'"]
+    }}
+  ]
+}}
+
+KWALITEITSEISEN (per document):
+- "is_correct_type" = ALLEEN true als het document ECHT het VERWACHTE TYPE van dat document is
+- "is_correct_fair" = true als het document {fair_name} of de beurs-organisator noemt EN het de juiste editie/locatie is{city_clause}
+- "is_correct_year" = true als het document {target_year} bevat
+- "is_useful" = true als het document nuttige info bevat voor standbouwers
+
+EXTRACTIE: zoek per document naar opbouw/afbouw datums en tijden (een apart entry per rij/dag/standgrootte), contact emails en telefoonnummers, de organiserende partij en verwijzingen naar andere documenten.
+
+Antwoord ALLEEN met valide JSON."""
+
+_BULK_DOCUMENT_ENTRY_TEMPLATE = """DOCUMENT {idx}
+URL: {url}
+VERWACHT TYPE: {expected_type} - {expected_desc}{precheck}
+TEKST:
+---
+{text_content}
+---"""
+
+
+_BATCH_CLASSIFY_PROMPT_TEMPLATE = """{classification_intro}
+
+DOCUMENTEN ({target_year}):
+{pdf_list}
+
+Classificeer elk document in een van de bovenstaande categorieën.
+
+Antwoord ALLEEN met valide JSON - een object met document indices per categorie:
+{{
+  "floorplan": [0, 5],
+  "exhibitor_manual": [2, 8],
+  "rules": [3],
+  "schedule": [7],
+  "skip": [1, 4, 6, 9]
+}}
+
+Regels:
+- Een document kan in MEERDERE categorieën voorkomen (bijv. een manual kan ook rules bevatten)
+- Prioriteer {target_year} documenten boven oudere versies
+- Wees RUIM: bij twijfel, classificeer het document liever dan het te skippen
+- ELKE index moet in minstens één categorie voorkomen"""
+
+_BATCH_CLASSIFY_ENTRY_TEMPLATE = """[{idx}] URL: {url}
+    Link text: {text}
+    Year: {year}"""
+
+
 class DocumentClassifier:
     """Classifies and validates documents found during prescan."""
 
     def __init__(self, anthropic_client, log_callback=None):
         self.client = anthropic_client
         self.log = log_callback or print
+        # LLM validation results keyed by _content_key(): the same document
+        # validated twice (retries, overlapping submissions) is only paid once.
+        # LRU-bounded to LLM_MEMO_SIZE for long-lived classifiers.
+        self._llm_results: "OrderedDict[str, Dict]" = OrderedDict()
+        self._llm_semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+        self._fetch_semaphore = asyncio.Semaphore(PDF_FETCH_CONCURRENCY)
+        # Validation requests waiting to be flushed together (see _queue_for_batch)
+        self._batch_queue: List[Tuple[str, Dict, Optional[Tuple], asyncio.Future]] = []
+        self._batch_flush: Optional[asyncio.Task] = None
+        # PDF text per URL: one download/parse even when several document
+        # types validate the same PDF concurrently
+        self._pdf_texts: Dict[str, asyncio.Task] = {}
+        # HEAD results per URL for this classifier's run; transient failures
+        # (timeouts, 5xx, rate limits) are not kept, so a retry probes again
+        self._pdf_probes: Dict[str, Tuple[int, str, str]] = {}
+        # Content version per PDF URL (see _pdf_version), part of its cache keys
+        self._pdf_versions: Dict[str, asyncio.Task] = {}
+        # Keep-alive HTTP session for PDF probes and downloads; owned by this
+        # classifier (jobs run in parallel threads) and released in close()
+        self._http_session = None
+        # Native async twin of self.client, created inside the running loop
+        self._async_client = None
+
+    def _recall_llm_result(self, content_key: str) -> Optional[Dict]:
+        """Memoized LLM answer for content_key (marked most recently used)."""
+        result = self._llm_results.get(content_key)
+        if result is not None:
+            self._llm_results.move_to_end(content_key)
+        return result
+
+    def _remember_llm_result(self, content_key: str, result: Dict) -> None:
+        """Memoize an LLM answer, evicting the least recently used beyond LLM_MEMO_SIZE."""
+        self._llm_results[content_key] = result
+        self._llm_results.move_to_end(content_key)
+        if len(self._llm_results) > LLM_MEMO_SIZE:
+            self._llm_results.popitem(last=False)
+
+    async def close(self) -> None:
+        """Release pooled HTTP connections once classification is done."""
+        self._pdf_texts.clear()
+        self._pdf_probes.clear()
+        self._pdf_versions.clear()
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    def _get_async_client(self):
+        """AsyncAnthropic with the sync client's credentials, or None.
+
+        None when the SDK lacks it or the client carries no API key (e.g.
+        test doubles); callers then run the sync client in a thread.
+        """
+        if self._async_client is None and ASYNC_ANTHROPIC_SUPPORT:
+            api_key = getattr(self.client, 'api_key', None)
+            if isinstance(api_key, str) and api_key:
+                self._async_client = AsyncAnthropic(
+                    api_key=api_key, base_url=getattr(self.client, 'base_url', None)
+                )
+        return self._async_client
+
+    async def _create_message(self, **kwargs):
+        """Call the Messages API without blocking the event loop.
+
+        Uses the native async client (the sync one in a worker thread when
+        that's unavailable), bounded by the classifier's semaphore so
+        concurrent validations overlap without exceeding rate limits.
+        Rate-limit errors are retried with backoff.
+        """
+        for attempt in range(4):
+            try:
+                async with self._llm_semaphore:
+                    async_client = self._get_async_client()
+                    if async_client is not None:
+                        return await async_client.messages.create(**kwargs)
+                    return await asyncio.to_thread(self.client.messages.create, **kwargs)
+            except Exception as rate_err:
+                is_rate_limit = 'rate_limit' in str(rate_err).lower() or '429' in str(rate_err)
+                if not is_rate_limit or attempt == 3:
+                    raise
+                wait = (2 ** attempt) * 3 + random.uniform(0, 2)
+                self.log(f"    ⏳ API rate limit (poging {attempt + 1}/4), wacht {wait:.0f}s...")
+                await asyncio.sleep(wait)
+
+    async def _queue_for_batch(
+        self, custom_id: str, params: Dict, bulk_doc: Optional[Tuple] = None
+    ) -> Optional[Dict]:
+        """Queue a validation request to be sent together with concurrent ones.
+
+        Requests arriving within BATCH_COLLECT_WINDOW of each other are flushed
+        together: those with a bulk_doc (url, text, expected_type, precheck,
+        fair_name, target_year, city) are validated several per Haiku call,
+        or, with USE_BATCH_API and enough of them, through the Message
+        Batches API. Returns the parsed result, or None when the caller
+        should use the regular Messages API (nothing to bundle with, or the
+        bulk call failed for this request).
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._batch_queue.append((custom_id, params, bulk_doc, future))
+        if self._batch_flush is None:
+            self._batch_flush = asyncio.ensure_future(self._flush_batch_queue())
+        return await future
+
+    async def _flush_batch_queue(self) -> None:
+        """Send queued validations as bulk calls (or one message batch), or release them for direct calls."""
+        await asyncio.sleep(BATCH_COLLECT_WINDOW)
+        queued, self._batch_queue = self._batch_queue, []
+        self._batch_flush = None  # requests arriving from now on start a new window
+
+        results: Dict[str, Dict] = {}
+        try:
+            # Identical concurrent requests share one custom_id — submit once
+            unique = {custom_id: params for custom_id, params, _, _ in queued}
+            if USE_BATCH_API and len(unique) >= BATCH_API_MIN_REQUESTS:
+                try:
+                    results = await self._run_message_batch(unique)
+                except Exception as e:
+                    self.log(f"  ⚠️ Batch API fout: {e} — terugval op bulk validatie")
+            results.update(await self._run_bulk_validation({
+                custom_id: bulk_doc for custom_id, _, bulk_doc, _ in queued
+                if bulk_doc and custom_id not in results
+            }))
+        except Exception as e:
+            self.log(f"  ⚠️ Bulk validatie fout: {e} — terugval op losse LLM calls")
+        finally:
+            for custom_id, _, _, future in queued:
+                if not future.done():
+                    future.set_result(results.get(custom_id))
+
+    async def _run_bulk_validation(self, bulk_docs: Dict[str, Tuple]) -> Dict[str, Dict]:
+        """Validate queued documents BULK_VALIDATION_CHUNK per Haiku call.
+
+        Documents are grouped per (fair, year, city); groups of one are left
+        for a direct call. Returns {custom_id: result} for covered documents.
+        """
+        groups: Dict[Tuple[str, str, str], List[Tuple[str, Tuple]]] = {}
+        for custom_id, (*doc, fair_name, target_year, city) in bulk_docs.items():
+            groups.setdefault((fair_name, target_year, city), []).append((custom_id, tuple(doc)))
+
+        results: Dict[str, Dict] = {}
+
+        async def validate_chunk(context, chunk):
+            fair_name, target_year, city = context
+            try:
+                answers = await self._validate_bulk_chunk(
+                    [doc for _, doc in chunk], fair_name,
+                    self._extract_fair_keywords(fair_name), target_year, city,
+                )
+            except Exception as e:
+                self.log(f"    ⚠️ Bulk validatie gefaald: {e} — valideer per document")
+                return
+            for idx, entry in answers.items():
+                results[chunk[idx][0]] = entry
+
+        chunks = [
+            (context, items[i:i + BULK_VALIDATION_CHUNK])
+            for context, items in groups.items()
+            for i in range(0, len(items), BULK_VALIDATION_CHUNK)
+            if len(items[i:i + BULK_VALIDATION_CHUNK]) >= 2
+        ]
+        if not chunks:
+            return results
+        await asyncio.gather(*(validate_chunk(context, chunk) for context, chunk in chunks))
+        self.log(f"  📑 Bulk validatie: {len(results)}/{len(bulk_docs)} documenten in {len(chunks)} call(s)")
+        return results
+
+    async def _run_message_batch(self, requests: Dict[str, Dict]) -> Dict[str, Dict]:
+        """Run validation requests through the Message Batches API.
+
+        Returns {custom_id: parsed JSON result} for the requests that succeeded.
+        """
+        # Older SDK versions only expose batches under the beta namespace
+        batches = getattr(self.client.messages, 'batches', None) or self.client.beta.messages.batches
+
+        batch = await asyncio.to_thread(
+            batches.create,
+            requests=[{"custom_id": custom_id, "params": params} for custom_id, params in requests.items()],
+        )
+        self.log(f"  📦 Batch API: {len(requests)} validaties ingediend ({batch.id})")
+
+        waited = 0
+        while batch.processing_status != 'ended':
+            if waited >= BATCH_MAX_WAIT:
+                await asyncio.to_thread(batches.cancel, batch.id)
+                raise TimeoutError(f"batch {batch.id} niet klaar na {BATCH_MAX_WAIT}s")
+            await asyncio.sleep(BATCH_POLL_INTERVAL)
+            waited += BATCH_POLL_INTERVAL
+            batch = await asyncio.to_thread(batches.retrieve, batch.id)
+
+        entries = await asyncio.to_thread(lambda: list(batches.results(batch.id)))
+        results: Dict[str, Dict] = {}
+        for entry in entries:
+            if entry.result.type != 'succeeded':
+                continue
+            try:
+                results[entry.custom_id] = _parse_llm_json(entry.result.message.content[0].text)
+            except Exception:
+                continue  # falls back to a direct call for this request
+
+        self.log(f"  📦 Batch API: {len(results)}/{len(requests)} validaties geslaagd")
+        return results
 
     async def classify_documents(
         self,
@@ -203,13 +1536,15 @@ class DocumentClassifier:
         portal_pages: List of {url, text_content, page_title, detected_type} from portal scan
         """
         result = ClassificationResult()
+        # Working set per document type, written back onto `result` once
+        # before the summary (plain dict lookups instead of getattr/setattr)
+        results_by_type: Dict[str, Optional[DocumentClassification]] = dict.fromkeys(RESULT_TYPES)
 
         self.log(f"📋 Classifying {len(pdf_links)} documents for {fair_name}...")
 
         # Extract fair name variations for matching
-        fair_name_lower = fair_name.lower()
         fair_keywords = self._extract_fair_keywords(fair_name)
-        self.log(f"  Fair keywords for matching: {fair_keywords}")
+        self.log(f"  Fair keywords for matching: {list(fair_keywords)}")
 
         # Build edition exclusion keywords to filter wrong editions of same fair
         # E.g., Greentech Amsterdam should not match "greentech-americas" or "greentech-asia"
@@ -221,45 +1556,50 @@ class DocumentClassifier:
         # Instead of brittle keyword matching, send all PDF URLs to Haiku in one call.
         # Haiku understands context (e.g., "btb_en.pdf" = Betriebstechnische Bestimmungen = rules)
         # and can classify in any language (DE, NL, FR, IT, ES, EN).
+        pdf_links = _normalize_pdf_links(pdf_links, target_year)
         candidates = await self._llm_batch_classify_pdfs(pdf_links, fair_name, target_year)
 
-        # Second pass: Validate best candidates with LLM (STRICT validation)
-        for doc_type, pdfs in candidates.items():
-            if not pdfs:
-                continue
-
-            # Sort by year (prefer target year) and take top candidates
-            def sort_by_relevance(pdf):
-                year = pdf.get('year') if isinstance(pdf, dict) else None
-                if year == target_year:
-                    return 0
-                elif year and year > target_year:
-                    return 1
-                elif year:
-                    return 2
-                return 3
-
-            sorted_pdfs = sorted(pdfs, key=sort_by_relevance)
-
-            # Validate top candidate(s) with STRICT criteria
-            for pdf in sorted_pdfs[:3]:  # Check top 3 candidates
-                url = pdf.get('url', '') if isinstance(pdf, dict) else pdf
-                classification = await self._validate_pdf_strict(
-                    url, doc_type, fair_name, fair_keywords, target_year,
-                    city=city, edition_exclusions=edition_exclusions,
-                )
+        # Second pass: Validate best candidates with LLM (STRICT validation),
+        # taking the top candidates by year rank (target year first)
+        # Validate top candidate(s) with STRICT criteria — all concurrently,
+        # then pick per type in relevance order (first strong wins, partial
+        # is kept as fallback). Once a type has its strong match, its
+        # lower-ranked candidates are cancelled so they cost no LLM call.
+        async def resolve(doc_type: str, tasks: List[Tuple[str, asyncio.Task]]) -> None:
+            for i, (url, task) in enumerate(tasks):
+                try:
+                    classification = await task
+                except Exception:
+                    continue
 
                 if classification.confidence == 'strong':
-                    setattr(result, doc_type, classification)
+                    results_by_type[doc_type] = classification
                     self.log(f"  ✓ {doc_type}: STRONG ✓year={classification.year_verified} ✓fair={classification.fair_verified}")
                     self.log(f"    URL: {url[:70]}...")
-                    break
-                elif classification.confidence == 'partial' and not getattr(result, doc_type):
+                    for _, pending in tasks[i + 1:]:
+                        pending.cancel()
+                    return
+                if classification.confidence == 'partial' and not results_by_type[doc_type]:
                     # Store partial as fallback, but keep looking for strong
-                    setattr(result, doc_type, classification)
+                    results_by_type[doc_type] = classification
                     self.log(f"  ~ {doc_type}: partial (year={classification.year_verified}, fair={classification.fair_verified})")
 
-            if not getattr(result, doc_type):
+        tasks_by_type: Dict[str, List[Tuple[str, asyncio.Task]]] = {}
+        for doc_type, pdfs in candidates.items():
+            for pdf in sorted(pdfs, key=itemgetter('rank'))[:3]:  # Check top 3 candidates
+                url = pdf['url']
+                tasks_by_type.setdefault(doc_type, []).append((url, asyncio.ensure_future(
+                    self._validate_pdf_strict(
+                        url, doc_type, fair_name, fair_keywords, target_year,
+                        city=city, edition_exclusions=edition_exclusions,
+                        prefetched_text=pdf['text'],
+                    )
+                )))
+
+        await asyncio.gather(*(resolve(doc_type, tasks) for doc_type, tasks in tasks_by_type.items()))
+
+        for doc_type, pdfs in candidates.items():
+            if pdfs and not results_by_type[doc_type]:
                 self.log(f"  ✗ {doc_type}: geen valide document gevonden")
 
         # PORTAL PAGES PHASE: Classify web page content from external portals
@@ -267,7 +1607,7 @@ class DocumentClassifier:
         if portal_pages:
             self.log(f"🌐 Classifying {len(portal_pages)} portal pages...")
             await self._classify_portal_pages(
-                portal_pages, result, fair_name, fair_keywords, target_year,
+                portal_pages, results_by_type, fair_name, fair_keywords, target_year,
                 city=city, edition_exclusions=edition_exclusions,
             )
 
@@ -275,44 +1615,51 @@ class DocumentClassifier:
         # If an exhibitor manual also contains rules/schedule, use it for those types too
         self.log("🔄 Cross-referencing validated documents...")
         for doc_type in ['exhibitor_manual', 'rules', 'schedule', 'floorplan']:
-            classification = getattr(result, doc_type)
+            classification = results_by_type[doc_type]
             if not classification or not classification.also_contains:
                 continue
 
             for also_type in classification.also_contains:
+                # Only known types; the LLM occasionally invents others
+                if also_type not in results_by_type:
+                    continue
                 # Only fill gaps — cross-references should NOT override dedicated pages
-                existing = getattr(result, also_type, None)
+                existing = results_by_type[also_type]
                 if not existing:
                     # Cross-referenced entries use 'partial' confidence (indirect source)
                     # This ensures dedicated portal sub-pages can still override them
-                    cross_ref = DocumentClassification(
-                        url=classification.url,
+                    # Copies the source's fields; what is its own (references,
+                    # also_contains, venue) stays with the source document
+                    cross_ref = replace(
+                        classification,
                         document_type=also_type,
                         confidence='partial',
-                        year=classification.year,
                         title=f"{classification.title} (bevat ook {also_type})" if classification.title else None,
                         reason=f"Cross-reference: gevonden in {doc_type} document",
-                        is_validated=classification.is_validated,
-                        text_excerpt=classification.text_excerpt,
-                        year_verified=classification.year_verified,
-                        fair_verified=classification.fair_verified,
-                        content_verified=classification.content_verified,
-                        extracted_schedule=classification.extracted_schedule,
-                        extracted_contacts=classification.extracted_contacts,
+                        venue_name=None,
+                        document_references=[],
+                        also_contains=[],
                     )
-                    setattr(result, also_type, cross_ref)
+                    results_by_type[also_type] = cross_ref
                     self.log(f"  🔄 Cross-ref: {doc_type} document bevat ook {also_type} info (partial) → {classification.url[:60]}...")
 
-        # Collect document references for secondary scan
-        all_references = []
+        # Collect document references for secondary scan. The same URL often
+        # comes back from several documents with stray whitespace or a
+        # trailing slash; keyed on the normalized form it is scanned once.
+        all_references: Dict[str, str] = {}
         for doc_type in ['exhibitor_manual', 'rules', 'schedule', 'floorplan']:
-            classification = getattr(result, doc_type)
+            classification = results_by_type[doc_type]
             if classification and classification.document_references:
                 for ref in classification.document_references:
-                    if ref and ref.startswith('http') and ref not in all_references:
-                        all_references.append(ref)
+                    ref = (ref or '').strip()
+                    ref_key = ref.rstrip('/')
+                    if ref.startswith('http') and ref_key not in all_references:
+                        all_references[ref_key] = ref
                         self.log(f"  📎 Document reference found: {ref[:60]}...")
-        result.extra_urls_to_scan = all_references
+        result.extra_urls_to_scan = list(all_references.values())
+
+        for doc_type, classification in results_by_type.items():
+            setattr(result, doc_type, classification)
 
         # Check for exhibitor directory (URL-based, no PDF validation)
         # Use scoring to prefer actual directory/list pages over resource pages
@@ -324,35 +1671,28 @@ class DocumentClassifier:
             fair_base_domain = ''
             if fair_url:
                 try:
-                    fair_base_domain = urlparse(fair_url).netloc.lower().replace('www.', '')
+                    fair_base_domain = _cached_urlparse(fair_url).netloc.lower().replace('www.', '')
                 except Exception:
                     pass
 
             for page in exhibitor_pages:
                 page_lower = page.lower()
-                parsed_page = urlparse(page_lower)
+                parsed_page = _cached_urlparse(page_lower)
                 page_host = parsed_page.netloc.replace('www.', '')
                 page_path = parsed_page.path.rstrip('/')
-                score = 0
 
                 # Strong directory indicators (high score)
-                if page_path.endswith('/exhibitors') or page_path.endswith('/exhibitor-list') or page_path.endswith('/exhibitor-lists'):
-                    score += 10  # Exact exhibitor directory path
-                if any(kw in page_path for kw in ['directory', 'catalogue', 'catalog', '/exhibitors']):
-                    score += 5
-                if any(kw in page_path for kw in ['exhibitor-list', 'exhibitor list', '/companies', '/espositori', '/aussteller']):
-                    score += 5
-                if any(kw in page_path for kw in ['/list', 'exposant']):
-                    score += 3
+                score = 10 if page_path.endswith(_DIR_EXACT_SUFFIXES) else 0  # Exact exhibitor directory path
+                for pattern, points in _DIR_SCORER:
+                    if pattern.search(page_path):
+                        score += points
 
                 # Weak indicators (these might be resource pages, not directories)
                 if 'exhibitor' in page_path and score == 0:
                     score += 1
 
                 # Penalty for non-directory pages
-                if any(kw in page_path for kw in ['resource', 'service', 'download', 'manual', 'guide', 'technical',
-                                                    'checklist', 'register', 'login', 'dashboard', 'faq',
-                                                    'shipping', 'marketing', 'contact', 'order', 'profile']):
+                if _DIR_PENALTY_RE.search(page_path):
                     score -= 3
 
                 # DOMAIN MATCHING: prevent cross-fair contamination
@@ -388,11 +1728,14 @@ class DocumentClassifier:
         strong_count = 0
 
         for doc_type in all_types:
-            classification = getattr(result, doc_type)
+            classification = results_by_type[doc_type]
             if classification:
                 if classification.confidence == 'strong':
                     result.found_types.append(doc_type)
-                    strong_count += 1
+                    # Trusted URL matches (CLASSIFY_TRUST_URL) are strong but
+                    # unverified: they don't count for skip_agent_safe
+                    if classification.is_validated:
+                        strong_count += 1
                 elif classification.confidence == 'partial':
                     # Partial goes to found_types but doesn't count for skip_agent_safe
                     result.found_types.append(doc_type)
@@ -426,29 +1769,36 @@ class DocumentClassifier:
 
         return result
 
-    def _extract_fair_keywords(self, fair_name: str) -> List[str]:
-        """Extract keywords from fair name for matching in documents."""
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _extract_fair_keywords(fair_name: str) -> Tuple[str, ...]:
+        """Extract keywords from fair name for matching in documents.
+
+        Memoized per fair name (discovery runs many fairs per process), hence
+        an immutable tuple; order is stable across runs.
+        """
         keywords = []
 
         # Clean and split
-        clean_name = re.sub(r'20\d{2}', '', fair_name).strip()
-        words = clean_name.lower().split()
+        clean_name = _YEAR_RE.sub('', fair_name).strip()
+        clean_lower = clean_name.lower()
+        words = clean_lower.split()
 
         # Add full name
-        keywords.append(clean_name.lower())
+        keywords.append(clean_lower)
 
         # Add individual significant words (>2 chars)
         for word in words:
-            if len(word) > 2 and word not in ['the', 'and', 'for', 'van', 'het', 'een']:
+            if len(word) > 2 and word not in _FAIR_NAME_STOPWORDS:
                 keywords.append(word)
 
         # Add common abbreviations/variations
-        if 'mwc' in clean_name.lower():
+        if 'mwc' in clean_lower:
             keywords.extend(['mwc', 'mobile world congress', 'gsma'])
-        if 'barcelona' in clean_name.lower():
+        if 'barcelona' in clean_lower:
             keywords.extend(['barcelona', 'fira', 'gran via'])
 
-        return list(set(keywords))
+        return tuple(dict.fromkeys(keywords))
 
     def _build_edition_exclusions(self, fair_name: str, city: str) -> List[str]:
         """Build list of URL path/filename fragments that indicate a wrong edition.
@@ -493,9 +1843,9 @@ class DocumentClassifier:
     async def _classify_portal_pages(
         self,
         portal_pages: List[Dict],
-        result: 'ClassificationResult',
+        results_by_type: Dict[str, Optional[DocumentClassification]],
         fair_name: str,
-        fair_keywords: List[str],
+        fair_keywords: Tuple[str, ...],
         target_year: str,
         city: str = "",
         edition_exclusions: List[str] = None,
@@ -505,6 +1855,7 @@ class DocumentClassifier:
 
         Portal pages are web pages (not PDFs) that contain exhibitor information.
         E.g., Salesforce OEM portals with stand build rules, schedules, etc.
+        Updates results_by_type (doc_type → best classification so far) in place.
         """
         # Map detected_type to our doc types
         type_mapping = {
@@ -515,6 +1866,9 @@ class DocumentClassifier:
             'unknown': None,  # Will try to detect
         }
 
+        # Phase 1: decide per page. Pages that need LLM validation are
+        # validated concurrently once all pages are planned.
+        planned = []  # (page, mapped_type, detected_type, auto_reason, validation task)
         for page in portal_pages:
             text_content = page.get('text_content')
             page_url = page.get('url', '')
@@ -540,16 +1894,16 @@ class DocumentClassifier:
             if not mapped_type:
                 continue
 
-            # Known floorplan providers: auto-classify as STRONG without LLM
-            # These are definitively floorplans regardless of text content
-            known_floorplan_providers = get_known_floorplan_providers()
+            # Known floorplan providers (_KNOWN_FLOORPLAN_PROVIDERS): auto-classify
+            # as STRONG without LLM. These are definitively floorplans regardless
+            # of text content.
+            url_lower = page_url.lower()
             # Also auto-accept floorplans on portal domains (Salesforce, etc.)
             # when detected by portal scan — interactive maps have minimal text
-            portal_domains = ['my.site.com', 'force.com', 'cvent.com', 'swapcard.com']
             is_portal_floorplan = (
                 mapped_type == 'floorplan'
                 and len(text_content or '') < 200
-                and any(pd in page_url.lower() for pd in portal_domains)
+                and bool(_PORTAL_DOMAIN_RE.search(url_lower))
             )
             # Auto-accept docs confirmed by site navigation (fair's own menu labelled it)
             # e.g., Greentech "Floor plan" → rai-productie.rai.nl
@@ -558,13 +1912,12 @@ class DocumentClassifier:
             # URL pattern (e.g., /show-layout, /floorplan, /maps, /hall-plan).
             # Interactive maps / image-based floorplans have minimal extractable text,
             # so LLM validation often fails. The URL pattern is a strong enough signal.
-            floorplan_url_patterns = DOCUMENT_TYPES['floorplan'].get('url_patterns', [])
             is_url_pattern_floorplan = (
                 mapped_type == 'floorplan'
-                and any(pat in page_url.lower() for pat in floorplan_url_patterns)
+                and bool(_FLOORPLAN_URL_RE and _FLOORPLAN_URL_RE.search(url_lower))
             )
             if mapped_type == 'floorplan' and (
-                any(fp in page_url.lower() for fp in known_floorplan_providers)
+                (_FLOORPLAN_PROVIDER_RE and _FLOORPLAN_PROVIDER_RE.search(url_lower))
                 or is_portal_floorplan
                 or is_nav_confirmed
                 or is_url_pattern_floorplan
@@ -575,58 +1928,63 @@ class DocumentClassifier:
                     reason = 'URL-pattern floorplan (e.g., /show-layout, /floorplan)'
                 else:
                     reason = 'Known floorplan provider (interactive)'
-                classification = DocumentClassification(
-                    url=page_url,
-                    document_type='floorplan',
-                    confidence='strong',
-                    title=page.get('page_title', 'Interactive Floorplan'),
-                    reason=reason,
-                    is_validated=True,
-                    year_verified=True,
-                    fair_verified=True,
-                    content_verified=True,
-                    text_excerpt=text_content[:1000],
-                )
-                existing = getattr(result, 'floorplan', None)
-                if not existing or existing.confidence != 'strong':
-                    setattr(result, 'floorplan', classification)
-                    self.log(f"  ✓ {reason}: {page_url[:70]}...")
+                planned.append((page, mapped_type, detected_type, reason, None))
+                continue
+
+            # Nav-confirmed non-floorplan: auto-classify as STRONG
+            # Fair's own navigation labelled this link (e.g., "Schedule", "Rules")
+            if is_nav_confirmed and mapped_type in ('schedule', 'rules', 'exhibitor_manual', 'exhibitor_directory'):
+                planned.append((page, mapped_type, detected_type, f'Navigation-confirmed {mapped_type}', None))
+                continue
+
+            # Validate the page content with LLM (same as PDF but no download needed)
+            # Note: we always validate portal pages even if a STRONG classification exists,
+            # because dedicated portal sub-pages (e.g., "Build up & Dismantling Schedule")
+            # have richer content than PDF keyword matches or cross-references
+            planned.append((page, mapped_type, detected_type, None, None))
+
+        # Started together, so their LLM requests meet in the batch queue and
+        # are validated several per call (see _queue_for_batch)
+        for i, (page, mapped_type, detected_type, auto_reason, _) in enumerate(planned):
+            if auto_reason:
                 continue
+            task = asyncio.ensure_future(self._validate_page_content(
+                page.get('url', ''), page['text_content'], mapped_type,
+                fair_name, fair_keywords, target_year,
+                page_title=page.get('page_title', ''),
+                city=city,
+                screenshot_base64=page.get('screenshot_base64'),
+            ))
+            planned[i] = (page, mapped_type, detected_type, None, task)
 
-            # Nav-confirmed non-floorplan: auto-classify as STRONG
-            # Fair's own navigation labelled this link (e.g., "Schedule", "Rules")
-            if is_nav_confirmed and mapped_type in ('schedule', 'rules', 'exhibitor_manual', 'exhibitor_directory'):
+        # Phase 2: apply results in original page order (order decides
+        # which page wins when several qualify for the same type)
+        for page, mapped_type, detected_type, auto_reason, task in planned:
+            text_content = page.get('text_content')
+            page_url = page.get('url', '')
+
+            if auto_reason:
                 classification = DocumentClassification(
                     url=page_url,
                     document_type=mapped_type,
                     confidence='strong',
-                    title=page.get('page_title', mapped_type),
-                    reason=f'Navigation-confirmed {mapped_type}',
+                    title=page.get('page_title', 'Interactive Floorplan' if mapped_type == 'floorplan' else mapped_type),
+                    reason=auto_reason,
                     is_validated=True,
                     year_verified=True,
                     fair_verified=True,
                     content_verified=True,
                     text_excerpt=text_content[:1000],
                 )
-                existing = getattr(result, mapped_type, None)
+                existing = results_by_type.get(mapped_type)
                 if not existing or existing.confidence != 'strong':
-                    setattr(result, mapped_type, classification)
-                    self.log(f"  ✓ Navigation-confirmed {mapped_type}: {page_url[:70]}...")
+                    results_by_type[mapped_type] = classification
+                    self.log(f"  ✓ {auto_reason}: {page_url[:70]}...")
                 continue
 
-            # Validate the page content with LLM (same as PDF but no download needed)
-            # Note: we always validate portal pages even if a STRONG classification exists,
-            # because dedicated portal sub-pages (e.g., "Build up & Dismantling Schedule")
-            # have richer content than PDF keyword matches or cross-references
-            classification = await self._validate_page_content(
-                page_url, text_content, mapped_type,
-                fair_name, fair_keywords, target_year,
-                page_title=page.get('page_title', ''),
-                city=city,
-                screenshot_base64=page.get('screenshot_base64'),
-            )
+            classification = await task
 
-            existing = getattr(result, mapped_type, None)
+            existing = results_by_type.get(mapped_type)
             if classification.confidence == 'strong':
                 should_replace = True
                 if existing and existing.confidence == 'strong':
@@ -647,11 +2005,11 @@ class DocumentClassifier:
                         self.log(f"  ≡ Portal page [{mapped_type}]: kept existing (better match)")
 
                 if should_replace:
-                    setattr(result, mapped_type, classification)
+                    results_by_type[mapped_type] = classification
                     self.log(f"  ✓ Portal page [{mapped_type}]: STRONG ✓year={classification.year_verified} ✓fair={classification.fair_verified}")
                     self.log(f"    URL: {page_url[:70]}...")
             elif classification.confidence == 'partial' and not existing:
-                setattr(result, mapped_type, classification)
+                results_by_type[mapped_type] = classification
                 self.log(f"  ~ Portal page [{mapped_type}]: partial")
             elif mapped_type == 'schedule' and classification.confidence in ('none', 'weak'):
                 # Fallback for portal schedule pages: interactive portals (Salesforce, Cvent)
@@ -660,15 +2018,10 @@ class DocumentClassifier:
                 # content keywords). If the URL/title also matches schedule patterns, or if
                 # the original detected_type was explicitly 'schedule', assign PARTIAL so the
                 # page is eligible for LLM re-validation with portal context.
-                schedule_url_slugs = [
-                    'schedule', 'build-up', 'tear-down', 'dismantling', 'move-in',
-                    'move-out', 'deadlines', 'key-dates', 'timetable', 'set-up',
-                    'logistics', 'important-dates', 'access-policy', 'event-schedule',
-                ]
                 url_lower = page_url.lower()
                 page_title_lower = (page.get('page_title') or '').lower()
                 url_or_title = f"{url_lower} {page_title_lower}"
-                has_schedule_url = any(slug in url_or_title for slug in schedule_url_slugs)
+                has_schedule_url = bool(_SCHEDULE_URL_SLUG_RE.search(url_or_title))
                 was_detected_as_schedule = (detected_type == 'schedule')
                 if has_schedule_url or was_detected_as_schedule:
                     original_conf = classification.confidence
@@ -676,7 +2029,7 @@ class DocumentClassifier:
                     fallback_reason = 'URL-pattern' if has_schedule_url else 'detected_type'
                     classification.reason = (classification.reason or '') + f' [portal schedule fallback: {fallback_reason}]'
                     if not existing:
-                        setattr(result, mapped_type, classification)
+                        results_by_type[mapped_type] = classification
                         self.log(f"  ~ Portal schedule [{mapped_type}]: PARTIAL ({fallback_reason} fallback, LLM was {original_conf})")
 
         # Post-process: LLM-validated promotion of weak/partial portal pages.
@@ -684,7 +2037,7 @@ class DocumentClassifier:
         # re-validate with extra context (the portal is confirmed for this fair).
         verified_portal_bases: Dict[str, str] = {}  # base → verified doc_type
         for doc_type in ['exhibitor_manual', 'rules', 'schedule', 'floorplan']:
-            cls = getattr(result, doc_type, None)
+            cls = results_by_type.get(doc_type)
             if cls and cls.confidence == 'strong' and cls.year_verified and cls.url:
                 base = self._get_portal_base(cls.url)
                 verified_portal_bases[base] = doc_type
@@ -697,7 +2050,7 @@ class DocumentClassifier:
                     page_text_map[page['url']] = page['text_content']
 
             for doc_type in ['exhibitor_manual', 'rules', 'schedule', 'floorplan']:
-                cls = getattr(result, doc_type, None)
+                cls = results_by_type.get(doc_type)
                 if cls and cls.confidence in ('partial', 'weak') and cls.url:
                     base = self._get_portal_base(cls.url)
                     if base in verified_portal_bases:
@@ -716,14 +2069,14 @@ class DocumentClassifier:
                                 city=city,
                             )
                             if new_cls and new_cls.confidence == 'strong':
-                                setattr(result, doc_type, new_cls)
+                                results_by_type[doc_type] = new_cls
                                 self.log(f"  ⬆ Promoted [{doc_type}] to STRONG (LLM confirmed, portal: {base})")
                             else:
                                 self.log(f"  ✗ [{doc_type}] NOT promoted (LLM rejected: {new_cls.reason if new_cls else 'error'})")
 
         # For portal home pages: if we have a portal URL but haven't assigned exhibitor_manual,
         # check if the portal home page qualifies as exhibitor manual
-        if not result.exhibitor_manual:
+        if not results_by_type.get('exhibitor_manual'):
             for page in portal_pages:
                 if page.get('detected_type') == 'exhibitor_manual' and page.get('text_content'):
                     # Portal home page as exhibitor manual (common pattern for OEM portals)
@@ -733,7 +2086,7 @@ class DocumentClassifier:
                         page_title=page.get('page_title', '')
                     )
                     if classification.confidence in ['strong', 'partial']:
-                        result.exhibitor_manual = classification
+                        results_by_type['exhibitor_manual'] = classification
                         self.log(f"  ✓ Portal home as exhibitor_manual: {classification.confidence}")
                         break
 
@@ -748,43 +2101,90 @@ class DocumentClassifier:
         For dedicated portal domains (e.g., exhibitors-seg.seafoodexpo.com),
         uses just the host since all pages belong to the same portal.
         """
-        parsed = urlparse(url)
+        parsed = _cached_urlparse(url)
         path_parts = parsed.path.strip('/').split('/')
-        shared_hosts = ['my.site.com', 'force.com', 'cvent.com', 'swapcard.com']
-        is_shared = any(sh in parsed.netloc for sh in shared_hosts)
+        is_shared = bool(_PORTAL_DOMAIN_RE.search(parsed.netloc))
         if is_shared and path_parts and path_parts[0]:
             return f"{parsed.netloc}/{path_parts[0]}"
         return parsed.netloc
 
+    def _apply_precheck_failure(
+        self, classification: DocumentClassification, expected_type: str,
+        url: str, title: str, target_year: str,
+    ) -> None:
+        """Outcome for a document whose text has neither the year nor the fair.
+
+        No LLM call is made either way. It stays a weak candidate unless its
+        URL/title also points away from the expected type, then it is dropped.
+        """
+        if self._type_relevance_score(expected_type, url, title) <= PRECHECK_REJECT_SCORE:
+            classification.confidence = 'none'
+            classification.reason = (f"Pre-filter: {target_year} en beursnaam niet in tekst, "
+                                     f"URL/titel wijst niet op {expected_type}")
+        else:
+            classification.confidence = 'weak'
+            classification.reason = f"Precheck gefaald: {target_year} en beursnaam niet in tekst"
+
     def _type_relevance_score(self, doc_type: str, url: str, title: str) -> int:
         """Score how well a URL/title matches a document type. Higher = better match.
         Uses scoring_keywords from central document_types registry.
         """
-        combined = f"{url} {title}".lower()
-        score = 0
-
-        scoring = get_scoring_keywords(doc_type)
-        if any(kw in combined for kw in scoring.get('strong', [])):
-            score += 10
-        if any(kw in combined for kw in scoring.get('medium', [])):
-            score += 5
-        if any(kw in combined for kw in scoring.get('penalties', [])):
-            score -= 5
-
-        return score
+        return _relevance_score(doc_type, f"{url} {title}".lower())
 
     def _detect_content_type(self, url: str, text: str) -> Optional[str]:
         """Detect document type from page URL and content.
         Uses content_keywords from central document_types registry.
         """
-        combined = f"{url} {text[:1500]}".lower()
+        return _content_type(f"{url} {text[:1500]}".lower())
 
-        # Check each document type's content keywords (from central registry)
-        for doc_type in ['rules', 'schedule', 'floorplan']:
-            if any(kw in combined for kw in get_content_keywords(doc_type)):
-                return doc_type
+    async def _validate_bulk_chunk(
+        self,
+        docs: List[Tuple[str, str, str, Optional[Tuple[bool, bool]]]],
+        fair_name: str,
+        fair_keywords: Tuple[str, ...],
+        target_year: str,
+        city: str = "",
+    ) -> Dict[int, Dict]:
+        """Validate several documents in one Haiku call.
 
-        return None
+        docs: (url, text, expected_type, precheck). Returns {index in docs:
+        validation result} for the documents the answer covers; raises when the
+        call fails or its JSON can't be parsed.
+        """
+        _, city_warning, city_clause = _prompt_fragments(docs[0][2], city)
+        entries = []
+        for idx, (url, text, expected_type, precheck) in enumerate(docs):
+            entries.append(_BULK_DOCUMENT_ENTRY_TEMPLATE.format_map({
+                'idx': idx,
+                'url': url,
+                'expected_type': expected_type,
+                'expected_desc': _prompt_fragments(expected_type, city)[0],
+                'precheck': _precheck_prompt_line(precheck, target_year),
+                'text_content': _condense_text(
+                    text, expected_type, target_year, fair_keywords, BULK_EXCERPT_CHARS
+                ),
+            }))
+        prompt = _BULK_VALIDATION_PROMPT_TEMPLATE.format_map({
+            'page_count': len(docs),
+            'fair_name': fair_name,
+            'target_year': target_year,
+            'city_warning': city_warning,
+            'city_clause': city_clause,
+            'pages': "\n\n".join(entries),
+        })
+        response = await self._create_message(
+            model="claude-haiku-4-5-20251001",
+            max_tokens=1000 * len(docs),
+            messages=[{"role": "user", "content": prompt}]
+        )
+        answers: Dict[int, Dict] = {}
+        for entry in _parse_llm_json(response.content[0].text).get('results', []):
+            idx = entry.get('idx') if isinstance(entry, dict) else None
+            if isinstance(idx, int) and 0 <= idx < len(docs):
+                entry = dict(entry)
+                entry.pop('idx')
+                answers[idx] = entry
+        return answers
 
     async def _validate_page_content(
         self,
@@ -792,7 +2192,7 @@ class DocumentClassifier:
         text_content: str,
         expected_type: str,
         fair_name: str,
-        fair_keywords: List[str],
+        fair_keywords: Tuple[str, ...],
         target_year: str,
         page_title: str = "",
         city: str = "",
@@ -806,6 +2206,12 @@ class DocumentClassifier:
         Interactive maps/images have little extractable text, so visual validation
         is often the only way to confirm a floorplan.
         """
+        cache_key = _page_cache_key(url, text_content, expected_type, fair_name, target_year, city)
+        cached = await asyncio.to_thread(_cache_get, cache_key)
+        if cached is not None:
+            self.log(f"    💾 Uit cache: {url[:60]}...")
+            return cached
+
         classification = DocumentClassification(
             url=url,
             document_type=expected_type,
@@ -813,7 +2219,7 @@ class DocumentClassifier:
         )
 
         try:
-            if not text_content or len(text_content) < 100:
+            if not text_content or len(text_content) < MIN_USEFUL_PAGE_CHARS:
                 # Floorplans with a screenshot can still be validated visually
                 if expected_type == 'floorplan' and screenshot_base64:
                     visual_result = await self._visual_validate_floorplan(
@@ -827,22 +2233,31 @@ class DocumentClassifier:
             classification.content_verified = True
             classification.text_excerpt = text_content[:1000]
 
-            # Check for year
-            text_lower = text_content.lower()
-            year_patterns = [target_year, target_year[2:]]
-            classification.year_verified = any(yp in text_content for yp in year_patterns)
+            # Check for year and fair name locally first
+            precheck = _local_precheck(text_content, target_year, fair_keywords)
+            classification.year_verified, classification.fair_verified = precheck
 
-            # Check for fair name
-            classification.fair_verified = any(kw in text_lower for kw in fair_keywords)
+            # Neither the year nor the fair appears anywhere: not worth a Haiku call
+            if not any(precheck):
+                if expected_type == 'floorplan' and screenshot_base64:
+                    visual_result = await self._visual_validate_floorplan(
+                        url, screenshot_base64, fair_name, target_year, page_title
+                    )
+                    if visual_result:
+                        return visual_result
+                self._apply_precheck_failure(classification, expected_type, url, page_title, target_year)
+                return classification
 
             # Use LLM for detailed validation (reuse same method as PDFs)
             validation_result = await self._llm_validate_and_extract(
-                text_content[:10000],
+                _smart_excerpt(text_content, target_year, fair_keywords),
                 expected_type,
                 fair_name,
                 target_year,
                 url,
                 city=city,
+                precheck=precheck,
+                min_chars=MIN_USEFUL_PAGE_CHARS,
             )
 
             classification.title = validation_result.get('title') or page_title
@@ -907,6 +2322,8 @@ class DocumentClassifier:
             classification.reason = f"Portal page validatie fout: {str(e)}"
             classification.confidence = 'none'
 
+        if _is_cacheable(classification):
+            await asyncio.to_thread(_cache_put, cache_key, classification)
         return classification
 
     async def _visual_validate_floorplan(
@@ -941,7 +2358,7 @@ class DocumentClassifier:
                 '{"is_floorplan": true/false, "reason": "brief explanation"}'
             )
 
-            response = self.client.messages.create(
+            response = await self._create_message(
                 model="claude-haiku-4-5-20251001",
                 max_tokens=200,
                 messages=[{
@@ -960,18 +2377,7 @@ class DocumentClassifier:
                 }],
             )
 
-            response_text = response.content[0].text.strip()
-
-            # Parse JSON response
-            import json as _json
-            # Handle markdown code blocks
-            if '```' in response_text:
-                response_text = response_text.split('```')[1]
-                if response_text.startswith('json'):
-                    response_text = response_text[4:]
-                response_text = response_text.strip()
-
-            result = _json.loads(response_text)
+            result = _parse_llm_json(response.content[0].text)
             is_floorplan = result.get('is_floorplan', False)
             reason = result.get('reason', '')
 
@@ -1015,84 +2421,32 @@ class DocumentClassifier:
         STRONG for this fair+year, then this page is also from the same fair.
         The LLM only needs to confirm the document TYPE is correct and content is useful.
         """
-        type_def = DOCUMENT_TYPES.get(expected_type, {})
-        expected_desc = type_def.get('llm_description', expected_type)
-
-        city_info = f" in {city}" if city else ""
-
-        prompt = f"""Je hervalideert een portal-pagina met extra context.
-
-CONTEXT: Deze pagina komt van het exhibitor portal "{portal_base}".
-Een andere pagina van HETZELFDE portal is al bevestigd als STRONG voor {fair_name}{city_info} ({target_year}).
-Dat betekent dat dit portal specifiek is voor {fair_name} {target_year}.
-De vraag is ALLEEN: bevat deze pagina nuttige {expected_type} ({expected_desc}) informatie?
-
-DOCUMENT URL: {url}
-VERWACHT TYPE: {expected_type} - {expected_desc}
-
-PAGINA TEKST:
----
-{text_content[:8000]}
----
-
-Beantwoord in JSON formaat:
-{{
-  "is_correct_type": true/false,
-  "is_useful": true/false,
-  "reason": "korte uitleg waarom wel/niet",
-
-  "schedule_found": true/false,
-  "build_up": [
-    {{"date": "2026-03-01", "time": "08:00-20:00", "description": "..."}}
-  ],
-  "tear_down": [
-    {{"date": "2026-03-05", "time": "18:00-22:00", "description": "..."}}
-  ],
-
-  "emails": ["email@example.com"],
-  "phones": ["+31 123 456 789"],
-  "organization": "naam van de organisatie"
-}}
-
-BELANGRIJK:
-- "is_correct_type" = ALLEEN true als dit ECHT {expected_type} content bevat
-- "is_useful" = true als het nuttige, concrete info bevat (niet alleen een menu of linklijst)
-- Je hoeft NIET te checken of het de juiste beurs/jaar is — dat is al bevestigd via het portal
-- Extraheer WEL schedule datums, emails en telefoons als die er staan
+        expected_desc = _prompt_fragments(expected_type, city)[0]
+        fair_keywords = self._extract_fair_keywords(fair_name)
+        excerpt = _condense_text(
+            _smart_excerpt(text_content, target_year, fair_keywords),
+            expected_type, target_year, fair_keywords,
+        )
 
-Antwoord ALLEEN met valide JSON."""
+        prompt = _REVALIDATION_PROMPT_TEMPLATE.format_map({
+            'portal_base': portal_base,
+            'fair_name': fair_name,
+            'city_info': f" in {city}" if city else "",
+            'target_year': target_year,
+            'expected_type': expected_type,
+            'expected_desc': expected_desc,
+            'url': url,
+            'text_content': excerpt,
+        })
 
         try:
-            import random as _rnd
-            response = None
-            for _api_attempt in range(4):
-                try:
-                    response = self.client.messages.create(
-                        model="claude-haiku-4-5-20251001",
-                        max_tokens=2000,
-                        messages=[{"role": "user", "content": prompt}]
-                    )
-                    break
-                except Exception as rate_err:
-                    if 'rate_limit' in str(rate_err).lower() or '429' in str(rate_err):
-                        wait = (2 ** _api_attempt) * 3 + _rnd.uniform(0, 2)
-                        self.log(f"    ⏳ API rate limit (poging {_api_attempt + 1}/4), wacht {wait:.0f}s...")
-                        await asyncio.sleep(wait)
-                        if _api_attempt == 3:
-                            raise
-                    else:
-                        raise
-
-            if response is None:
-                return None
-
-            response_text = response.content[0].text.strip()
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0].strip()
+            response = await self._create_message(
+                model="claude-haiku-4-5-20251001",
+                max_tokens=2000,
+                messages=[{"role": "user", "content": prompt}]
+            )
 
-            validation = json.loads(response_text)
+            validation = _parse_llm_json(response.content[0].text)
 
             is_correct_type = validation.get('is_correct_type', False)
             is_useful = validation.get('is_useful', False)
@@ -1165,73 +2519,26 @@ Antwoord ALLEEN met valide JSON."""
 
         # Build PDF list for the prompt (max 60 to keep prompt reasonable)
         pdf_entries = []
-        for i, pdf in enumerate(pdf_links[:60]):
-            url = pdf.get('url', '') if isinstance(pdf, dict) else pdf
-            text = pdf.get('text', '') if isinstance(pdf, dict) else ''
-            year = pdf.get('year', '') if isinstance(pdf, dict) else ''
-            pdf_entries.append(f"[{i}] URL: {url}\n    Link text: {text or '(geen)'}\n    Year: {year or '?'}")
-
-        pdf_list = "\n".join(pdf_entries)
-
-        # Generate classification prompt from central registry
-        classification_intro = get_llm_classification_prompt(fair_name, context='pdfs')
-
-        prompt = f"""{classification_intro}
-
-DOCUMENTEN ({target_year}):
-{pdf_list}
-
-Classificeer elk document in een van de bovenstaande categorieën.
-
-Antwoord ALLEEN met valide JSON - een object met document indices per categorie:
-{{
-  "floorplan": [0, 5],
-  "exhibitor_manual": [2, 8],
-  "rules": [3],
-  "schedule": [7],
-  "skip": [1, 4, 6, 9]
-}}
-
-Regels:
-- Een document kan in MEERDERE categorieën voorkomen (bijv. een manual kan ook rules bevatten)
-- Prioriteer {target_year} documenten boven oudere versies
-- Wees RUIM: bij twijfel, classificeer het document liever dan het te skippen
-- ELKE index moet in minstens één categorie voorkomen"""
+        for i, pdf in enumerate(pdf_links[:BATCH_CLASSIFY_MAX_PDFS]):
+            pdf_entries.append(_BATCH_CLASSIFY_ENTRY_TEMPLATE.format_map({
+                'idx': i, 'url': pdf['url'], 'text': pdf['text'] or '(geen)', 'year': pdf['year'] or '?',
+            }))
+
+        # Classification intro generated from the central registry
+        prompt = _BATCH_CLASSIFY_PROMPT_TEMPLATE.format_map({
+            'classification_intro': get_llm_classification_prompt(fair_name, context='pdfs'),
+            'target_year': target_year,
+            'pdf_list': "\n".join(pdf_entries),
+        })
 
         try:
-            import random as _rnd
-            response = None
-            for _api_attempt in range(4):
-                try:
-                    response = self.client.messages.create(
-                        model="claude-haiku-4-5-20251001",
-                        max_tokens=1000,
-                        messages=[{"role": "user", "content": prompt}]
-                    )
-                    break
-                except Exception as rate_err:
-                    if 'rate_limit' in str(rate_err).lower() or '429' in str(rate_err):
-                        wait = (2 ** _api_attempt) * 3 + _rnd.uniform(0, 2)
-                        self.log(f"    ⏳ API rate limit (poging {_api_attempt + 1}/4), wacht {wait:.0f}s...")
-                        await asyncio.sleep(wait)
-                        if _api_attempt == 3:
-                            raise
-                    else:
-                        raise
-
-            if response is None:
-                self.log("  ⚠️ LLM batch classification failed — falling back to keyword matching")
-                return self._keyword_classify_pdfs(pdf_links)
-
-            response_text = response.content[0].text.strip()
-
-            # Parse JSON
-            if "```" in response_text:
-                json_match = re.search(r'```(?:json)?\s*(.*?)\s*```', response_text, re.DOTALL)
-                if json_match:
-                    response_text = json_match.group(1)
+            response = await self._create_message(
+                model="claude-haiku-4-5-20251001",
+                max_tokens=1000,
+                messages=[{"role": "user", "content": prompt}]
+            )
 
-            result = json.loads(response_text)
+            result = _parse_llm_json(response.content[0].text)
 
             # Map indices back to PDF entries
             for doc_type in ['floorplan', 'exhibitor_manual', 'rules', 'schedule']:
@@ -1254,28 +2561,19 @@ Regels:
     def _keyword_classify_pdfs(self, pdf_links: List[Dict]) -> Dict[str, List[Dict]]:
         """Fallback: keyword-based classification if LLM batch fails.
         Uses pdf_keywords from central document_types registry.
+        pdf_links: entries from _normalize_pdf_links.
+
+        Each PDF goes to its single best-matching category (most distinct
+        keyword hits, ties by _PDF_CATEGORY_PRIORITY), so an ambiguous file
+        is downloaded and validated once instead of once per category.
         """
-        candidates = {
-            'floorplan': [],
-            'exhibitor_manual': [],
-            'rules': [],
-            'schedule': [],
-        }
+        candidates = {doc_type: [] for doc_type in _PDF_CATEGORIES}
 
         for pdf in pdf_links:
-            url = pdf.get('url', '') if isinstance(pdf, dict) else pdf
-            text = pdf.get('text', '') if isinstance(pdf, dict) else ''
-            combined = f"{url.lower()} {text.lower()}"
-
-            for doc_type in candidates:
-                pdf_kws = get_pdf_keywords(doc_type)
-                if pdf_kws and any(kw in combined for kw in pdf_kws):
-                    # For floorplan, check exclusions
-                    if doc_type == 'floorplan':
-                        exclusions = get_pdf_exclusions(doc_type)
-                        if any(excl in combined for excl in exclusions):
-                            continue
-                    candidates[doc_type].append(pdf)
+            scores = _pdf_keyword_scores(pdf['combined'])
+            if scores:
+                best = max(_PDF_CATEGORY_PRIORITY, key=lambda t: scores.get(t, 0))
+                candidates[best].append(pdf)
 
         return candidates
 
@@ -1284,13 +2582,16 @@ Regels:
         url: str,
         expected_type: str,
         fair_name: str,
-        fair_keywords: List[str],
+        fair_keywords: Tuple[str, ...],
         target_year: str,
         city: str = "",
         edition_exclusions: List[str] = None,
+        prefetched_text: Optional[str] = None,
     ) -> DocumentClassification:
         """
         STRICT validation of a PDF document.
+        prefetched_text: PDF text the prescan already has; used instead of a
+        download when it is at least PREFETCHED_TEXT_MIN_CHARS long.
 
         Requirements for STRONG confidence:
         1. Document type matches expected type
@@ -1298,6 +2599,32 @@ Regels:
         3. Document mentions fair/venue name
         4. Document has extractable, meaningful content
         """
+        # The cached verdict only holds for the same PDF content: a fair may
+        # replace last year's manual under the same URL
+        if prefetched_text and len(prefetched_text) >= PREFETCHED_TEXT_MIN_CHARS:
+            version = hashlib.sha256(prefetched_text.encode('utf-8', errors='replace')).hexdigest()
+        else:
+            version = await self._pdf_version(url)
+        cache_key = None
+        if version:
+            cache_key = _classification_cache_key(url, expected_type, fair_name, target_year, city, version)
+            cached = await asyncio.to_thread(_cache_get, cache_key)
+            if cached is not None:
+                self.log(f"    💾 Uit cache: {url[:60]}...")
+                return cached
+
+        if (TRUST_URL_MATCHES and _url_strong_match(url, expected_type, target_year)
+                and not any(excl in url.lower() for excl in edition_exclusions or ())):
+            self.log(f"    ⚡ URL-match vertrouwd (niet gedownload): {url[:60]}...")
+            return DocumentClassification(
+                url=url,
+                document_type=expected_type,
+                confidence='strong',
+                year=target_year,
+                reason="URL bevat documenttype en jaar (inhoud niet gecontroleerd)",
+                year_verified=True,
+            )
+
         classification = DocumentClassification(
             url=url,
             document_type=expected_type,
@@ -1305,8 +2632,11 @@ Regels:
         )
 
         try:
-            # Download and extract PDF text
-            text_content = await self._extract_pdf_text(url, max_bytes=300_000)
+            # Download and extract PDF text, unless the prescan already did
+            if prefetched_text and len(prefetched_text) >= PREFETCHED_TEXT_MIN_CHARS:
+                text_content = prefetched_text
+            else:
+                text_content = await self._get_pdf_text(url, target_year)
 
             if not text_content or len(text_content) < 100:
                 classification.reason = "PDF bevat geen leesbare tekst of is te kort"
@@ -1326,22 +2656,24 @@ Regels:
                         self.log(f"    ✗ Skipping wrong-edition PDF: {url[:60]}... (contains '{excl}')")
                         return classification
 
-            # Check for year in content
-            text_lower = text_content.lower()
-            year_patterns = [target_year, target_year[2:]]  # 2026 or 26
-            classification.year_verified = any(yp in text_content for yp in year_patterns)
+            # Check for year (2026 or 26) and fair/venue name in content
+            precheck = _local_precheck(text_content, target_year, fair_keywords)
+            classification.year_verified, classification.fair_verified = precheck
 
-            # Check for fair/venue name in content
-            classification.fair_verified = any(kw in text_lower for kw in fair_keywords)
+            # Neither the year nor the fair appears anywhere: not worth a Haiku call
+            if not any(precheck):
+                self._apply_precheck_failure(classification, expected_type, url, "", target_year)
+                return classification
 
             # Use LLM for detailed validation and content extraction
             validation_result = await self._llm_validate_and_extract(
-                text_content[:10000],  # Limit for Haiku
+                _smart_excerpt(text_content, target_year, fair_keywords),  # Limit for Haiku
                 expected_type,
                 fair_name,
                 target_year,
                 url,
                 city=city,
+                precheck=precheck,
             )
 
             # Update classification with LLM results
@@ -1395,47 +2727,134 @@ Regels:
             classification.reason = f"Validatie fout: {str(e)}"
             classification.confidence = 'none'
 
+        if cache_key and _is_cacheable(classification):
+            await asyncio.to_thread(_cache_put, cache_key, classification)
         return classification
 
-    async def _extract_pdf_text(self, url: str, max_bytes: int = 300_000) -> str:
-        """Extract text from PDF URL."""
+    async def _get_pdf_text(self, url: str, target_year: str = "") -> str:
+        """Extracted PDF text, shared between all validations of the same URL."""
+        task = self._pdf_texts.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._extract_pdf_text(url, target_year=target_year))
+            self._pdf_texts[url] = task
+        # Shielded: a cancelled validation must not cancel the shared download
+        return await asyncio.shield(task)
+
+    def _get_http_session(self) -> Optional["requests.Session"]:
+        """This classifier's HTTP session, created on first use (None without requests)."""
+        if self._http_session is None:
+            self._http_session = _new_http_session()
+        return self._http_session
+
+    async def _pdf_version(self, url: str) -> Optional[str]:
+        """Content version of the PDF at url, shared by all its validations:
+        the HEAD ETag/Last-Modified, else a hash of the first
+        PDF_FINGERPRINT_BYTES. None when neither can be had (the cache is
+        then bypassed)."""
+        task = self._pdf_versions.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_pdf_version(url))
+            self._pdf_versions[url] = task
+        return await asyncio.shield(task)
+
+    async def _fetch_pdf_version(self, url: str) -> Optional[str]:
+        async with self._fetch_semaphore:
+            status, _, version = await self._probe_pdf(url)
+        if version:
+            return version
+        if status >= 400:
+            return None
+        try:
+            head = await self._fetch_pdf(url, PDF_FINGERPRINT_BYTES)
+        except Exception:
+            return None
+        return hashlib.sha256(head).hexdigest() if head else None
+
+    async def _probe_pdf(self, url: str) -> Tuple[int, str, str]:
+        """HEAD result for url, probed once per run unless it failed transiently."""
+        probe = self._pdf_probes.get(url)
+        if probe is None:
+            probe = await asyncio.to_thread(_probe_pdf_url, self._get_http_session(), url)
+            status = probe[0]
+            if status not in _TRANSIENT_HTTP_STATUSES and status < 500:
+                self._pdf_probes[url] = probe
+        return probe
+
+    async def _fetch_pdf(self, url: str, max_bytes: int) -> bytes:
+        """Download (the first max_bytes of) a PDF without blocking the event loop."""
+        async with self._fetch_semaphore:
+            return await asyncio.to_thread(_download_pdf_bytes, self._get_http_session(), url, max_bytes)
+
+    async def _parse_pdf_bytes(self, pdf_bytes: bytes, target_year: str = "") -> str:
+        """Extract PDF text off the event loop.
+
+        Parsing runs in the shared worker process pool so concurrent
+        validations keep running; where worker processes can't be started
+        (or die) it falls back to a thread.
+        """
+        if not _pdf_pool_disabled:
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(
+                    _get_pdf_pool(), _extract_text_from_pdf_bytes, pdf_bytes, PDF_MAX_PAGES, target_year
+                )
+            except (BrokenProcessPool, NotImplementedError, PermissionError) as e:
+                self.log(f"    ⚠️ PDF worker processes niet beschikbaar ({type(e).__name__}), parse in thread")
+                _disable_pdf_pool()
+        return await asyncio.to_thread(_extract_text_from_pdf_bytes, pdf_bytes, PDF_MAX_PAGES, target_year)
+
+    async def _extract_pdf_text(
+        self, url: str, max_bytes: int = PDF_INITIAL_BYTES, target_year: str = ""
+    ) -> str:
+        """Extract text from PDF URL (see _extract_text_from_pdf_bytes for target_year)."""
 
         if not PDF_SUPPORT:
             # Fallback: just analyze URL/filename
             return f"[PDF URL: {url}] - No PDF library available"
 
+        # The same PDFs come back across fairs and runs: reuse their text,
+        # as long as the file behind the URL hasn't changed
+        version = await self._pdf_version(url)
+        text_cache_key = _pdf_text_cache_key(url, target_year, version) if version else None
+        if text_cache_key:
+            cached = await asyncio.to_thread(_cache_read, 'pdf_text', text_cache_key)
+            if cached:
+                return cached
+
         try:
-            # Download PDF
-            req = urllib.request.Request(
-                url,
-                headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                }
-            )
+            # Cheap HEAD first: dead links and HTML pages behind a .pdf URL
+            # are dropped without downloading them. Size is not checked,
+            # the download is capped anyway.
+            async with self._fetch_semaphore:
+                status, content_type, _ = await self._probe_pdf(url)
+            if status in (404, 410):
+                return f"[HTTP error {status}]"
+            if content_type.startswith(_NON_PDF_CONTENT_TYPES):
+                return ""
 
-            with urllib.request.urlopen(req, timeout=20) as response:
-                pdf_bytes = response.read(max_bytes)
+            # Download PDF
+            pdf_bytes = await self._fetch_pdf(url, max_bytes)
 
             if len(pdf_bytes) < 1000:
                 return ""  # Too small, probably an error page
 
             # Try to extract text
-            pdf_file = io.BytesIO(pdf_bytes)
-
             try:
-                reader = pypdf.PdfReader(pdf_file)
-                text_parts = []
-
-                # Extract from first 10 pages (for schedule/contact extraction)
-                for i, page in enumerate(reader.pages[:10]):
-                    try:
-                        text = page.extract_text()
-                        if text:
-                            text_parts.append(text)
-                    except:
-                        continue
-
-                return "\n".join(text_parts)
+                truncated = len(pdf_bytes) >= max_bytes and max_bytes < PDF_MAX_BYTES
+                try:
+                    text = await self._parse_pdf_bytes(pdf_bytes, target_year)
+                except Exception:
+                    if not truncated:
+                        raise
+                    # Cut off inside the PDF (xref/trailer missing) and
+                    # unreadable that way: fetch the whole file. A window that
+                    # parses cleanly but has no text (scans, image-only PDFs)
+                    # is not refetched — the full file would be no better.
+                    pdf_bytes = await self._fetch_pdf(url, PDF_MAX_BYTES)
+                    text = await self._parse_pdf_bytes(pdf_bytes, target_year)
+                if text and text_cache_key:
+                    await asyncio.to_thread(_cache_write, 'pdf_text', text_cache_key, text)
+                return text
 
             except Exception as e:
                 return f"[PDF parse error: {str(e)}]"
@@ -1453,165 +2872,106 @@ Regels:
         target_year: str,
         url: str,
         city: str = "",
+        precheck: Optional[Tuple[bool, bool]] = None,
+        min_chars: int = MIN_USEFUL_CHARS,
     ) -> Dict:
         """
         Use Haiku to validate document AND extract additional info.
+        precheck: (year_in_text, fair_in_text) from _local_precheck, stated in the prompt.
+        min_chars: shorter text is judged not useful without an LLM call.
 
         Returns validation results plus:
         - Schedule dates/times if found
         - Contact emails/phones if found
         - Organization name if found
         """
-        # Use semantic descriptions from central document_types registry
-        type_def = DOCUMENT_TYPES.get(expected_type, {})
-        expected_desc = type_def.get('llm_description', expected_type)
-
-        city_warning = ""
-        if city:
-            city_warning = f"""
-GEZOCHTE STAD/EDITIE: {city}
-⚠️ LET OP EDITIE: Sommige beurzen hebben meerdere edities (bijv. Americas, Asia, Europe).
-   Dit document moet specifiek voor de {city}-editie zijn. Als het document voor een ANDERE
-   editie is (bijv. Americas ipv Amsterdam, Asia ipv Barcelona), dan is "is_correct_fair" = false!"""
-
-        prompt = f"""Analyseer dit document GRONDIG en extraheer ALLE informatie.
-
-DOCUMENT URL: {url}
-GEZOCHTE BEURS: {fair_name}
-GEZOCHT JAAR: {target_year}
-VERWACHT TYPE: {expected_type} - {expected_desc}{city_warning}
-
-DOCUMENT TEKST:
----
-{text_content}
----
-
-Beantwoord in JSON formaat:
-{{
-  "is_correct_type": true/false,
-  "is_correct_fair": true/false,
-  "is_correct_year": true/false,
-  "is_useful": true/false,
-  "detected_year": "2024/2025/2026/unknown",
-  "title": "document titel",
-  "reason": "korte uitleg",
-
-  "schedule_found": true/false,
-  "build_up": [
-    {{"date": "2026-03-01", "time": "08:00-20:00", "description": "..."}}
-  ],
-  "tear_down": [
-    {{"date": "2026-03-05", "time": "18:00-22:00", "description": "..."}}
-  ],
-
-  "emails": ["email@example.com"],
-  "phones": ["+31 123 456 789"],
-  "organization": "naam van de organisatie",
-
-  "document_references": ["URLs of namen van andere documenten die in dit document worden genoemd, bijv. 'Technical Guidelines available at https://...' of 'See Event Manual for details'"],
-  "also_contains_types": ["andere documenttypes die dit document OOK bevat. Keuzes: 'rules', 'schedule', 'exhibitor_manual', 'floorplan'. Bijv. als een exhibitor manual ook technische regels bevat, zet 'rules'. Als het ook opbouw/afbouw datums en tijden bevat, zet 'schedule'."]
-}}
-
-KWALITEITSEISEN:
-- "is_correct_type" = ALLEEN true als dit ECHT een {expected_type} is
-- "is_correct_fair" = true als document {fair_name} of de beurs-organisator noemt EN het de juiste editie/locatie is{f' (moet voor {city} zijn, NIET voor een andere editie zoals Americas/Asia/etc.)' if city else ''}
-- "is_correct_year" = true als document {target_year} bevat
-- "is_useful" = true als document nuttige info bevat voor standbouwers
-
-EXTRACTIE (HEEL BELANGRIJK - zoek naar ALLES):
-- Zoek naar opbouw/afbouw datums en tijden (ook als dit niet het verwachte type is!)
-- Maak voor ELKE rij in een opbouw/afbouw tabel een apart entry. Als er per standgrootte (bijv. "Over 950m2", "Under 25m2") verschillende startdatums zijn, maak dan voor ELKE standgrootte een apart build_up entry met de standgrootte in de description.
-- Maak voor ELKE dag van afbouw een apart tear_down entry met datum en openingstijd.
-- Zoek naar contact emails en telefoonnummers
-- Zoek naar de naam van de organiserende partij
-- Zoek naar VERWIJZINGEN naar andere documenten (URLs, documentnamen, "zie document X")
-- Bevat dit document OOK info van een ander type? Bijv. een exhibitor manual/welcome pack kan ook technische regels of een opbouwschema bevatten - dit is HEEL BELANGRIJK om te detecteren!
+        # Fast path: skip the LLM for empty or garbled text — it can't be useful
+        stripped = text_content.strip()
+        if len(stripped) < min_chars or _is_garbled(stripped):
+            return {
+                'is_correct_type': False,
+                'is_correct_fair': False,
+                'is_correct_year': False,
+                'is_useful': False,
+                'reason': 'Te weinig bruikbare tekst voor LLM validatie',
+            }
 
-Antwoord ALLEEN met valide JSON."""
+        content_key = _content_key(url, text_content, expected_type, fair_name, target_year, city)
+        cached = self._recall_llm_result(content_key)
+        if cached is None:
+            cached = await asyncio.to_thread(_cache_read, 'llm_cache', _llm_cache_key(content_key))
+        if cached is not None:
+            self._remember_llm_result(content_key, cached)
+            return cached
+
+        prompt = _VALIDATION_PROMPT_TEMPLATE.format_map({
+            'url': url,
+            'precheck': _precheck_prompt_line(precheck, target_year),
+            'text_content': _condense_text(
+                text_content, expected_type, target_year, self._extract_fair_keywords(fair_name)
+            ),
+        })
+
+        params = {
+            "model": "claude-haiku-4-5-20251001",
+            "max_tokens": 2000,
+            "system": [{
+                "type": "text",
+                "text": _validation_system_prompt(expected_type, fair_name, target_year, city),
+                "cache_control": {"type": "ephemeral"},
+            }],
+            "messages": [{"role": "user", "content": prompt}],
+        }
 
         try:
-            import random as _rnd
-            response = None
-            for _api_attempt in range(4):
-                try:
-                    response = self.client.messages.create(
-                        model="claude-haiku-4-5-20251001",
-                        max_tokens=2000,
-                        messages=[{"role": "user", "content": prompt}]
-                    )
-                    break
-                except Exception as rate_err:
-                    if 'rate_limit' in str(rate_err).lower() or '429' in str(rate_err):
-                        wait = (2 ** _api_attempt) * 3 + _rnd.uniform(0, 2)
-                        self.log(f"    ⏳ API rate limit (poging {_api_attempt + 1}/4), wacht {wait:.0f}s...")
-                        await asyncio.sleep(wait)
-                        if _api_attempt == 3:
-                            raise
-                    else:
-                        raise
-
-            if response is None:
-                raise RuntimeError("API call failed after retries")
-
-            response_text = response.content[0].text.strip()
-
-            # Parse JSON from response
-            if "```" in response_text:
-                json_match = re.search(r'```(?:json)?\s*(.*?)\s*```', response_text, re.DOTALL)
-                if json_match:
-                    response_text = json_match.group(1)
-
-            result = json.loads(response_text)
-
+            # Concurrent validations are bundled into bulk calls; when there
+            # is nothing to bundle with (or the bulk call fails) fall back to
+            # a regular Messages API call
+            result = await self._queue_for_batch(
+                content_key, params,
+                bulk_doc=(url, text_content, expected_type, precheck, fair_name, target_year, city),
+            )
+            if result is None:
+                response = await self._create_message(**params)
+                response_text = response.content[0].text if response.content else ""
+                # Refusals, empty or prose-only answers: no JSON to parse
+                if '{' not in response_text:
+                    self.log("    LLM validation error: geen JSON in antwoord")
+                    return _fallback_validation(text_content, target_year, "geen JSON in antwoord")
+                result = _parse_llm_json(response_text)
+                if not isinstance(result, dict):
+                    return _fallback_validation(text_content, target_year, "onverwacht JSON antwoord")
+
+            self._remember_llm_result(content_key, result)
+            await asyncio.to_thread(_cache_write, 'llm_cache', _llm_cache_key(content_key), result)
             return result
 
         except Exception as e:
             self.log(f"    LLM validation error: {e}")
-            # Fallback to basic checks
-            return {
-                'is_correct_type': False,
-                'is_correct_fair': False,
-                'is_correct_year': target_year in text_content,
-                'is_useful': len(text_content) > 500,
-                'reason': f'LLM validatie gefaald: {str(e)}'
-            }
+            return _fallback_validation(text_content, target_year, str(e))
 
     async def _aggregate_extracted_info(self, result: ClassificationResult) -> None:
         """Aggregate extracted info from all classified documents."""
 
-        # Collect all schedules (deduplicate by date+time)
-        all_build_up = []
-        all_tear_down = []
-        seen_build_up = set()
-        seen_tear_down = set()
-        all_emails = []
-        all_phones = []
-        organization = None
+        docs = [c for c in (result.exhibitor_manual, result.rules, result.schedule, result.floorplan) if c]
+        schedules = [c.extracted_schedule for c in docs if c.extracted_schedule]
+        contacts = [c.extracted_contacts for c in docs if c.extracted_contacts]
 
-        for doc_type in ['exhibitor_manual', 'rules', 'schedule', 'floorplan']:
-            classification = getattr(result, doc_type)
-            if not classification:
-                continue
+        # Schedules deduplicated by date+time; dicts as ordered sets keep the
+        # first-seen entry, in document priority order
+        all_build_up = _dedupe_schedule_entries(chain.from_iterable(s.build_up for s in schedules))
+        all_tear_down = _dedupe_schedule_entries(chain.from_iterable(s.tear_down for s in schedules))
 
-            # Aggregate schedules with deduplication
-            if classification.extracted_schedule:
-                for entry in classification.extracted_schedule.build_up:
-                    dedup_key = (entry.get('date', ''), entry.get('time', ''))
-                    if dedup_key not in seen_build_up:
-                        seen_build_up.add(dedup_key)
-                        all_build_up.append(entry)
-                for entry in classification.extracted_schedule.tear_down:
-                    dedup_key = (entry.get('date', ''), entry.get('time', ''))
-                    if dedup_key not in seen_tear_down:
-                        seen_tear_down.add(dedup_key)
-                        all_tear_down.append(entry)
-
-            # Aggregate contacts
-            if classification.extracted_contacts:
-                all_emails.extend(classification.extracted_contacts.emails)
-                all_phones.extend(classification.extracted_contacts.phones)
-                if classification.extracted_contacts.organization and not organization:
-                    organization = classification.extracted_contacts.organization
+        # Emails by their normalized form; phones by digits, keeping the
+        # first-seen readable spelling
+        emails = dict.fromkeys(
+            email.strip().lower() for email in chain.from_iterable(c.emails for c in contacts) if email
+        )
+        phones: Dict[str, str] = {}
+        for phone in chain.from_iterable(c.phones for c in contacts):
+            if phone:
+                phones.setdefault(_phone_key(phone), phone.strip())
+        organization = next((c.organization for c in contacts if c.organization), None)
 
         # Store aggregated results
         if all_build_up or all_tear_down:
@@ -1621,13 +2981,13 @@ Antwoord ALLEEN met valide JSON."""
             )
             self.log(f"  📅 Extracted schedule: {len(all_build_up)} build-up, {len(all_tear_down)} tear-down entries")
 
-        if all_emails or all_phones:
+        if emails or phones:
             result.aggregated_contacts = ExtractedContact(
-                emails=list(set(all_emails)),  # Dedupe
-                phones=list(set(all_phones)),
+                emails=list(emails),
+                phones=list(phones.values()),
                 organization=organization
             )
-            self.log(f"  📧 Extracted contacts: {len(set(all_emails))} emails, {len(set(all_phones))} phones")
+            self.log(f"  📧 Extracted contacts: {len(emails)} emails, {len(phones)} phones")
 
         # Generate search hints based on what we found
         self._generate_search_hints(result)
@@ -1649,9 +3009,9 @@ Antwoord ALLEEN met valide JSON."""
             # Check if any found document has schedule info
             for doc_type in ['exhibitor_manual', 'rules']:
                 classification = getattr(result, doc_type)
-                if classification and classification.extracted_schedule:
-                    if classification.extracted_schedule.build_up or classification.extracted_schedule.tear_down:
-                        hints.append(f"Schema informatie gevonden in {doc_type} document")
+                sched = classification.extracted_schedule if classification else None
+                if sched and (sched.build_up or sched.tear_down):
+                    hints.append(f"Schema informatie gevonden in {doc_type} document")
 
         # If we have document references from found docs
         if result.extra_urls_to_scan:
@@ -1662,29 +3022,81 @@ Antwoord ALLEEN met valide JSON."""
             self.log(f"  💡 Search hints: {'; '.join(hints)}")
 
 
-async def quick_classify_url(url: str) -> Tuple[str, str]:
+# URL keywords for quick_classify_url, checked in this order — the first
+# matching category wins.
+_QUICK_URL_KEYWORDS = (
+    ('floorplan', (
+        'floor', 'plan', 'map', 'hall', 'layout', 'plattegrond',
+        'show-layout', 'show_layout', '/maps', 'site-plan', 'venue-map',
+    )),
+    ('exhibitor_manual', (
+        'exhibitor', 'manual', 'welcome', 'pack', 'handbook', 'guide',
+    )),
+    ('rules', (
+        'technical', 'regulation', 'rule', 'guideline', 'normativ',
+    )),
+    ('schedule', (
+        'schedule', 'timing', 'build', 'move-in', 'opbouw',
+    )),
+)
+# Compiled once at import: one regex per category (also used by the pandas
+# batch path) and one automaton tagging each keyword with its category's
+# priority, so a URL is classified in a single scan.
+_QUICK_URL_PATTERNS = [
+    (doc_type, _keyword_regex(list(keywords))) for doc_type, keywords in _QUICK_URL_KEYWORDS
+]
+_QUICK_URL_AUTOMATON = _build_keyword_automaton(
+    [(kw, priority) for priority, (_, keywords) in enumerate(_QUICK_URL_KEYWORDS) for kw in keywords]
+)
+
+
+def _quick_classify(url_lower: str) -> Tuple[str, str]:
+    """Match a lowercased URL against the quick URL keywords, in priority order."""
+    if _QUICK_URL_AUTOMATON is not None:
+        priorities = _automaton_tags(_QUICK_URL_AUTOMATON, url_lower)
+        if priorities:
+            return (_QUICK_URL_KEYWORDS[min(priorities)][0], 'weak')
+        return ('unknown', 'none')
+    for doc_type, pattern in _QUICK_URL_PATTERNS:
+        if pattern.search(url_lower):
+            return (doc_type, 'weak')
+    return ('unknown', 'none')
+
+
+@lru_cache(maxsize=4096)
+def quick_classify_url(url: str) -> Tuple[str, str]:
     """
     Quick classification based on URL only (no download).
     Returns (document_type, confidence).
+
+    Pure and deterministic, so results are memoized — URLs recur across
+    re-crawls and retries during discovery.
     """
-    url_lower = url.lower()
-    filename = url.split('/')[-1].lower()
+    return _quick_classify(url.lower())
 
-    # Floorplan
-    if any(kw in url_lower for kw in ['floor', 'plan', 'map', 'hall', 'layout', 'plattegrond',
-                                       'show-layout', 'show_layout', '/maps', 'site-plan', 'venue-map']):
-        return ('floorplan', 'weak')
 
-    # Exhibitor manual
-    if any(kw in url_lower for kw in ['exhibitor', 'manual', 'welcome', 'pack', 'handbook', 'guide']):
-        return ('exhibitor_manual', 'weak')
+def quick_classify_urls(urls: List[str]) -> List[Tuple[str, str]]:
+    """
+    Batch variant of quick_classify_url for large sets of crawled URLs.
 
-    # Rules
-    if any(kw in url_lower for kw in ['technical', 'regulation', 'rule', 'guideline', 'normativ']):
-        return ('rules', 'weak')
+    Runs each category pattern once over the whole column with pandas'
+    vectorized string ops instead of classifying URL by URL.
+    Returns one (document_type, confidence) tuple per input URL, in order.
+    """
+    try:
+        import numpy as np
+        import pandas as pd
+    except ImportError:
+        return [quick_classify_url(url) for url in urls]
 
-    # Schedule
-    if any(kw in url_lower for kw in ['schedule', 'timing', 'build', 'move-in', 'opbouw']):
-        return ('schedule', 'weak')
+    if not urls:
+        return []
 
-    return ('unknown', 'none')
+    urls_lower = pd.Series(urls, dtype='string').str.lower()
+    matches = [
+        urls_lower.str.contains(pattern, na=False).to_numpy(dtype=bool)
+        for _, pattern in _QUICK_URL_PATTERNS
+    ]
+    # np.select takes the first matching condition, same as the if-cascade
+    labels = np.select(matches, [doc_type for doc_type, _ in _QUICK_URL_PATTERNS], default='unknown')
+    return [(label, 'weak' if label != 'unknown' else 'none') for label in labels.tolist()]
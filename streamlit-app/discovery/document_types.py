@@ -11,7 +11,15 @@ Architecture:
 - get_all_keywords(): returns flat keyword list for fast-path matching
 """
 
-from typing import Dict, List, Set
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+# Optional: Aho-Corasick for one-pass multi-keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_SUPPORT = True
+except ImportError:
+    AHOCORASICK_SUPPORT = False
 
 # =============================================================================
 # CENTRAL DOCUMENT TYPE DEFINITIONS
@@ -375,22 +383,24 @@ DOCUMENT_TYPES: Dict[str, dict] = {
 # =============================================================================
 # DERIVED CONSTANTS — auto-generated from DOCUMENT_TYPES
 # =============================================================================
+# DOCUMENT_TYPES is fixed at import, so the derived collections are built on
+# first use and cached; they are returned as tuples so no caller can change
+# the shared copy.
 
-def get_scan_frontier_paths() -> List[str]:
+@lru_cache(maxsize=None)
+def get_scan_frontier_paths() -> Tuple[str, ...]:
     """Generate URL paths to always try during pre-scan.
-    Returns deduplicated list from all document types' url_patterns.
+    Returns deduplicated paths from all document types' url_patterns.
     """
-    paths = []
-    seen = set()
-    for doc_type in DOCUMENT_TYPES.values():
-        for path in doc_type.get('url_patterns', []):
-            if path not in seen:
-                seen.add(path)
-                paths.append(path)
-    return paths
+    return tuple(dict.fromkeys(
+        path
+        for doc_type in DOCUMENT_TYPES.values()
+        for path in doc_type.get('url_patterns', [])
+    ))
 
 
-def get_doc_keywords() -> List[str]:
+@lru_cache(maxsize=None)
+def get_doc_keywords() -> Tuple[str, ...]:
     """Generate flat keyword list for fast-path link matching.
     Used in prescan to decide if a link is worth following.
     """
@@ -411,10 +421,11 @@ def get_doc_keywords() -> List[str]:
         'standbouw', 'standhouder', 'opbouw', 'afbouw', 'toegang',
         'contractor', 'terms-and-condition', 'terms_and_condition',
     ])
-    return sorted(keywords)
+    return tuple(sorted(keywords))
 
 
-def get_page_keywords() -> List[str]:
+@lru_cache(maxsize=None)
+def get_page_keywords() -> Tuple[str, ...]:
     """Generate keywords for portal page scanning."""
     keywords = set()
     for doc_type in DOCUMENT_TYPES.values():
@@ -424,7 +435,7 @@ def get_page_keywords() -> List[str]:
         for kw in doc_type.get('content_keywords', []):
             if len(kw) >= 4:
                 keywords.add(kw)
-    return sorted(keywords)
+    return tuple(sorted(keywords))
 
 
 def get_known_floorplan_providers() -> List[str]:
@@ -432,6 +443,16 @@ def get_known_floorplan_providers() -> List[str]:
     return DOCUMENT_TYPES['floorplan'].get('known_providers', [])
 
 
+@lru_cache(maxsize=None)
+def _types_prompt_list(context: str) -> str:
+    """The '- "type": description' lines of the classification prompt."""
+    return '\n'.join(
+        f'- "{type_name}": {type_def["llm_description"]}'
+        for type_name, type_def in DOCUMENT_TYPES.items()
+        if type_name != 'exhibitor_directory' or context == 'pages'
+    )
+
+
 def get_llm_classification_prompt(fair_name: str = '', context: str = 'links') -> str:
     """Generate LLM classification prompt from semantic descriptions.
 
@@ -440,15 +461,7 @@ def get_llm_classification_prompt(fair_name: str = '', context: str = 'links') -
         context: 'links' for link classification, 'pages' for page content,
                  'pdfs' for PDF classification
     """
-    type_descriptions = []
-    for type_name, type_def in DOCUMENT_TYPES.items():
-        if type_name == 'exhibitor_directory' and context != 'pages':
-            continue
-        type_descriptions.append(
-            f'- "{type_name}": {type_def["llm_description"]}'
-        )
-
-    types_str = '\n'.join(type_descriptions)
+    types_str = _types_prompt_list(context)
 
     if context == 'links':
         return f"""You are helping discover exhibitor documentation for the trade fair "{fair_name}".
@@ -502,6 +515,14 @@ def get_type_search_hints(doc_type: str) -> List[str]:
     return type_def.get('search_hints', [])
 
 
+# Scoring buckets: (level, registry field, weight in a relevance score)
+SCORING_LEVELS = (
+    ('strong', 'scoring_keywords_strong', 10),
+    ('medium', 'scoring_keywords_medium', 5),
+    ('penalties', 'scoring_penalties', -5),
+)
+
+
 def get_scoring_keywords(doc_type: str) -> dict:
     """Get scoring keywords for a document type.
     Returns {'strong': [...], 'medium': [...], 'penalties': [...]}.
@@ -534,9 +555,120 @@ def get_pdf_exclusions(doc_type: str) -> List[str]:
     return DOCUMENT_TYPES.get(doc_type, {}).get('pdf_exclusions', [])
 
 
-def get_all_url_patterns() -> List[str]:
+@lru_cache(maxsize=None)
+def get_all_url_patterns() -> Tuple[str, ...]:
     """Get all URL patterns across all document types."""
-    patterns = []
-    for type_def in DOCUMENT_TYPES.values():
-        patterns.extend(type_def.get('url_patterns', []))
-    return patterns
+    return tuple(
+        pattern
+        for type_def in DOCUMENT_TYPES.values()
+        for pattern in type_def.get('url_patterns', [])
+    )
+
+
+# =============================================================================
+# KEYWORD MATCHING — one scan over a text for many keyword lists
+# =============================================================================
+
+# Keyword fields that describe a page or link (as opposed to PDF-only lists)
+KEYWORD_FIELDS = ('title_keywords', 'content_keywords')
+
+
+def _selected_types(doc_type: Optional[str]):
+    """(type name, definition) pairs for one document type, or all of them."""
+    if doc_type is None:
+        return DOCUMENT_TYPES.items()
+    return [(doc_type, DOCUMENT_TYPES[doc_type])] if doc_type in DOCUMENT_TYPES else []
+
+
+@lru_cache(maxsize=None)
+def build_keyword_automaton(doc_type: Optional[str] = None, fields: Tuple[str, ...] = KEYWORD_FIELDS):
+    """Aho-Corasick automaton over the keywords of one type (or all types).
+
+    Each match yields (keyword, frozenset of document types listing it).
+    Built once per (doc_type, fields). None when pyahocorasick isn't
+    installed or there are no keywords (match_keyword_types falls back to
+    substring tests).
+    """
+    if not AHOCORASICK_SUPPORT:
+        return None
+    types_by_keyword: Dict[str, Set[str]] = {}
+    for type_name, type_def in _selected_types(doc_type):
+        for field_name in fields:
+            for kw in type_def.get(field_name, []):
+                types_by_keyword.setdefault(kw, set()).add(type_name)
+    if not types_by_keyword:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw, type_names in types_by_keyword.items():
+        automaton.add_word(kw, (kw, frozenset(type_names)))
+    automaton.make_automaton()
+    return automaton
+
+
+def match_keyword_types(
+    text_lower: str, doc_type: Optional[str] = None, fields: Tuple[str, ...] = KEYWORD_FIELDS
+) -> Set[str]:
+    """Document types with at least one keyword (from fields) in text_lower.
+
+    Keywords are lowercase, so pass lowercased text. One automaton pass when
+    pyahocorasick is available, else a substring test per keyword.
+    """
+    automaton = build_keyword_automaton(doc_type, fields)
+    if automaton is not None:
+        found: Set[str] = set()
+        for _, (_, type_names) in automaton.iter(text_lower):
+            found |= type_names
+        return found
+    return {
+        type_name
+        for type_name, type_def in _selected_types(doc_type)
+        if any(kw in text_lower for field_name in fields for kw in type_def.get(field_name, []))
+    }
+
+
+@lru_cache(maxsize=None)
+def _scoring_keyword_table() -> Tuple[Tuple[str, FrozenSet[Tuple[str, int]]], ...]:
+    """Every scoring keyword once, tagged with the (type, weight) buckets
+    listing it (see SCORING_LEVELS)."""
+    tags_by_keyword: Dict[str, Set[Tuple[str, int]]] = {}
+    for type_name, type_def in DOCUMENT_TYPES.items():
+        for _, field_name, weight in SCORING_LEVELS:
+            for kw in type_def.get(field_name, []):
+                tags_by_keyword.setdefault(kw, set()).add((type_name, weight))
+    return tuple((kw, frozenset(tags)) for kw, tags in tags_by_keyword.items())
+
+
+@lru_cache(maxsize=None)
+def _scoring_automaton():
+    """Aho-Corasick automaton over _scoring_keyword_table, or None without
+    pyahocorasick."""
+    if not AHOCORASICK_SUPPORT:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw, tags in _scoring_keyword_table():
+        automaton.add_word(kw, tags)
+    automaton.make_automaton()
+    return automaton
+
+
+def score_text(text_lower: str) -> Dict[str, int]:
+    """URL/title relevance of lowercased text to every document type at once.
+
+    Each scoring bucket adds its weight once when any of its keywords occurs
+    (strong +10, medium +5, penalties -5). Types without a hit are left out.
+    A single scan over the text finds the hit buckets of all types; without
+    pyahocorasick, one substring test per distinct keyword.
+    """
+    automaton = _scoring_automaton()
+    hits: Set[Tuple[str, int]] = set()
+    if automaton is not None:
+        for _, tags in automaton.iter(text_lower):
+            hits |= tags
+    else:
+        for kw, tags in _scoring_keyword_table():
+            if kw in text_lower:
+                hits |= tags
+    scores: Dict[str, int] = {}
+    for doc_type, weight in hits:
+        scores[doc_type] = scores.get(doc_type, 0) + weight
+    return scores
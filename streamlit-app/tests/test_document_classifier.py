@@ -0,0 +1,64 @@
+"""Tests for the pure helpers in discovery.document_classifier."""
+
+import pytest
+
+from discovery.document_classifier import _parse_llm_json
+
+
+class TestParseLlmJson:
+    def test_plain_object(self):
+        assert _parse_llm_json('{"a": 1}') == {"a": 1}
+
+    def test_fenced_object(self):
+        assert _parse_llm_json('```json\n{"a": 1}\n```') == {"a": 1}
+
+    def test_prose_before_object(self):
+        assert _parse_llm_json('Here is the result: {"a": 1}') == {"a": 1}
+
+    def test_object_first_trailing_prose(self):
+        assert _parse_llm_json('{"a":1} hope this helps') == {"a": 1}
+
+    def test_no_object_raises(self):
+        with pytest.raises(ValueError):
+            _parse_llm_json('no json here')
+
+
+class TestPdfKeywordScores:
+    """The keyword fallback must score the same with or without pyahocorasick."""
+
+    @staticmethod
+    def _samples():
+        import random
+
+        from discovery.document_types import get_pdf_exclusions, get_pdf_keywords
+        from discovery.document_classifier import _PDF_CATEGORIES
+
+        words = [kw for t in _PDF_CATEGORIES for kw in (*get_pdf_keywords(t), *get_pdf_exclusions(t))]
+        words += ['reg_', 'doc', '2026', '-', '/']
+        rng = random.Random(42)
+        samples = ['show-layout reg_']
+        for _ in range(3000):
+            samples.append(''.join(rng.choice(words) for _ in range(rng.randint(1, 4))))
+        return samples
+
+    def test_automaton_and_fallback_agree(self, monkeypatch):
+        pytest.importorskip('ahocorasick')
+        import discovery.document_classifier as dc
+
+        assert dc._PDF_KEYWORD_AUTOMATON is not None
+        samples = self._samples()
+        with_automaton = [dc._pdf_keyword_scores(s) for s in samples]
+        monkeypatch.setattr(dc, '_PDF_KEYWORD_AUTOMATON', None)
+        without_automaton = [dc._pdf_keyword_scores(s) for s in samples]
+        assert with_automaton == without_automaton
+
+    def test_overlapping_keywords_count_separately(self, monkeypatch):
+        import discovery.document_classifier as dc
+
+        monkeypatch.setattr(dc, '_PDF_KEYWORD_AUTOMATON', None)
+        combined = 'show-layout reg_'
+        expected = {
+            t: n for t in dc._PDF_CATEGORIES
+            if (n := sum(kw in combined for kw in dc._PDF_CATEGORY_KEYWORDS[t]))
+        }
+        assert dc._pdf_keyword_scores(combined) == expected
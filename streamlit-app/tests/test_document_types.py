@@ -0,0 +1,41 @@
+"""Tests for the keyword scoring in discovery.document_types."""
+
+import random
+
+import pytest
+
+import discovery.document_types as dt
+
+
+def _samples():
+    words = [kw for t in dt.DOCUMENT_TYPES for kws in dt.get_scoring_keywords(t).values() for kw in kws]
+    words += ['foo', '2026', '-', '/']
+    rng = random.Random(42)
+    return [' '.join(rng.choice(words) for _ in range(rng.randint(0, 4))) for _ in range(2000)]
+
+
+def _score_per_type(text_lower):
+    """Reference: one pass per type and bucket, as the scoring was defined."""
+    scores = {}
+    for doc_type in dt.DOCUMENT_TYPES:
+        buckets = dt.get_scoring_keywords(doc_type)
+        score = sum(
+            weight for level, _, weight in dt.SCORING_LEVELS
+            if any(kw in text_lower for kw in buckets[level])
+        )
+        if any(kw in text_lower for kws in buckets.values() for kw in kws):
+            scores[doc_type] = score
+    return scores
+
+
+class TestScoreText:
+    def test_fallback_matches_per_type_scoring(self, monkeypatch):
+        monkeypatch.setattr(dt, '_scoring_automaton', lambda: None)
+        for text in _samples():
+            assert dt.score_text(text) == _score_per_type(text)
+
+    def test_automaton_matches_per_type_scoring(self):
+        pytest.importorskip('ahocorasick')
+        assert dt._scoring_automaton() is not None
+        for text in _samples():
+            assert dt.score_text(text) == _score_per_type(text)